@@ -1,11 +1,13 @@
 from __future__ import annotations
-import math, time, random
+import math, time
 import numpy as np
 from typing import List, Tuple, Optional, Dict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 from dataclasses import dataclass, field
 
 from atc.utils import nm_to_px
+from .gridhash import GridHash
+from .snapshot import PlaneSnapshot
 from constants import SAFE_LAT_NM, SAFE_VERT_FT, HELPER_CONFLICT_THRESHOLD, ML_MODEL_PATH, HELPER_UPDATE_INTERVAL
 
 try:
@@ -14,10 +16,12 @@ try:
 except ImportError:
     ML_AVAILABLE = False
 
+_PX_PER_NM = nm_to_px(1)
+_SAFE_LAT_NM_2 = SAFE_LAT_NM * 2
+_SAFE_VERT_FT_3 = SAFE_VERT_FT * 3
+
 def distance_nm(a, b) -> float:
-    dx, dy = a.x - b.x, a.y - b.y
-    dist_px = math.hypot(dx, dy)
-    return dist_px / nm_to_px(1)
+    return math.hypot(a.x - b.x, a.y - b.y) / _PX_PER_NM
 
 def heading_diff(h1: float, h2: float) -> float:
     return abs(((h1 - h2 + 180) % 360) - 180)
@@ -37,6 +41,7 @@ class MLAssistant:
     predicted_conflicts: list[tuple[str, str, float]] = field(default_factory=list)
     suggestions: list[tuple[str, str]] = field(default_factory=list)
     executor: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(max_workers=1))
+    _inflight: Optional[Future] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if ML_AVAILABLE:
@@ -52,12 +57,14 @@ class MLAssistant:
         else:
             print("[ML] joblib not available. Using heuristic fallback.")
 
-    def update_async(self, planes: List, runways: List) -> None:
-        now = time.time()
+    def update_async(self, snapshot: PlaneSnapshot, runways: List) -> None:
+        now = time.monotonic()
         if now - self.last_update < HELPER_UPDATE_INTERVAL:
             return
+        if self._inflight is not None and not self._inflight.done():
+            return
         self.last_update = now
-        self.executor.submit(self._update_predictions, planes, runways)
+        self._inflight = self.executor.submit(self._update_predictions, snapshot, runways)
 
     def get_conflicts(self) -> List[tuple[str, str, float]]:
         return self.predicted_conflicts
@@ -65,53 +72,87 @@ class MLAssistant:
     def get_suggestions(self) -> List[tuple[str, str]]:
         return self.suggestions
     
-    def _update_predictions(self, planes: List, runways: List) -> None:
-        conflicts = self._predict_conflicts(planes)
-        suggestions = self._generate_suggestions(conflicts, planes)
+    def _update_predictions(self, snapshot: PlaneSnapshot, runways: List) -> None:
+        conflicts = self._predict_conflicts(snapshot)
+        suggestions = self._generate_suggestions(conflicts, snapshot.planes)
         self.predicted_conflicts = conflicts
         self.suggestions = suggestions
 
-    def _predict_conflicts(self, planes: List) -> List[tuple[str, str, float]]:
-        results = []
-        for index in range(len(planes)):
-            for nxt in range(index + 1, len(planes)):
-                a, b = planes[index], planes[nxt]
-                risk = self._pair_conflict_risk(a, b)
-                if risk >= HELPER_CONFLICT_THRESHOLD:
-                    results.append((a.callsign, b.callsign, risk))
-        return results
-    
-    def _pair_conflict_risk(self, a, b) -> float:
+    def _predict_conflicts(self, snapshot: PlaneSnapshot) -> List[tuple[str, str, float]]:
+        if len(snapshot) < 2:
+            return []
+
+        iu, ju = self._candidate_pairs(snapshot)
+        if len(iu) == 0:
+            return []
+        features = self._pair_features(snapshot, iu, ju)
+
         if self.conflict_model:
-            features = np.array(extract_features(a, b)).reshape(1, -1)
-            prob = float(self.conflict_model.predict_proba(features)[0, 1])
-            return prob
-        
-        dist_nm = distance_nm(a, b)
-        vert_ft = abs(a.alt - b.alt)
-        hdg_delta = heading_diff(a.hdg, b.hdg)
-        risk = 0.0
-
-        if dist_nm < SAFE_LAT_NM * 2:
-            risk += (SAFE_LAT_NM * 2 - dist_nm) / (SAFE_LAT_NM * 2)
-        if vert_ft < SAFE_VERT_FT * 3:
-            risk += (SAFE_VERT_FT * 3 - vert_ft) / (SAFE_VERT_FT * 3)
-        if hdg_delta < 45:
-            risk += 0.2
-
-        return min(risk / 2.0, 1.0)
+            pair_risk = self.conflict_model.predict_proba(features)[:, 1]
+        else:
+            pair_risk = self._heuristic_risk_matrix(features)
+
+        hits = np.nonzero(pair_risk >= HELPER_CONFLICT_THRESHOLD)[0]
+        callsigns = snapshot.callsigns
+        return [
+            (callsigns[iu[k]], callsigns[ju[k]], float(pair_risk[k]))
+            for k in hits
+        ]
+
+    def _candidate_pairs(self, snapshot: PlaneSnapshot) -> Tuple[np.ndarray, np.ndarray]:
+        """Index pairs (i < j) within 2 * SAFE_LAT_NM of each other.
+
+        Pairs further apart than that cannot reach HELPER_CONFLICT_THRESHOLD
+        under the heuristic, so they are never scored.
+        """
+        radius = _SAFE_LAT_NM_2 * _PX_PER_NM
+        xs, ys = snapshot.x.tolist(), snapshot.y.tolist()
+        grid = GridHash(cell=radius)
+        for index, (x, y) in enumerate(zip(xs, ys)):
+            grid.insert(x, y, index)
+
+        iu, ju = [], []
+        for index, (x, y) in enumerate(zip(xs, ys)):
+            for other in grid.query_radius(x, y, radius):
+                if other > index:
+                    iu.append(index)
+                    ju.append(other)
+        return np.array(iu, dtype=np.intp), np.array(ju, dtype=np.intp)
+
+    def _pair_features(self, snapshot: PlaneSnapshot, iu: np.ndarray, ju: np.ndarray) -> np.ndarray:
+        """Build the (P, 4) feature matrix matching `extract_features` for every pair."""
+        xs, ys = snapshot.x, snapshot.y
+        alts, spds, hdgs = snapshot.alt, snapshot.spd, snapshot.hdg
+
+        features = np.empty((len(iu), 4), dtype=np.float32)
+        features[:, 0] = np.hypot(xs[iu] - xs[ju], ys[iu] - ys[ju]) / _PX_PER_NM
+        features[:, 1] = np.abs(alts[iu] - alts[ju])
+        features[:, 2] = np.abs(spds[iu] - spds[ju])
+        features[:, 3] = np.abs(((hdgs[iu] - hdgs[ju] + 180) % 360) - 180)
+        return features
+
+    def _heuristic_risk_matrix(self, features: np.ndarray) -> np.ndarray:
+        dist_nm, vert_ft, hdg_delta = features[:, 0], features[:, 1], features[:, 3]
+        risk = (
+            np.where(dist_nm < _SAFE_LAT_NM_2, (_SAFE_LAT_NM_2 - dist_nm) / _SAFE_LAT_NM_2, 0.0)
+            + np.where(vert_ft < _SAFE_VERT_FT_3, (_SAFE_VERT_FT_3 - vert_ft) / _SAFE_VERT_FT_3, 0.0)
+            + np.where(hdg_delta < 45, 0.2, 0.0)
+        )
+        return np.minimum(risk / 2.0, 1.0)
     
     def _generate_suggestions(self, conflicts: List[tuple[str, str, float]], planes: List) -> List[tuple[str, str]]:
         suggestions = []
-        for ac1, ac2, risk in conflicts:
-            p1 = next((p for p in planes if p.callsign == ac1), None)
-            p2 = next((p for p in planes if p.callsign == ac2), None)
+        turn_right = np.random.random(len(conflicts)) < 0.5
+        turn_degs = np.random.choice([10, 15, 20], size=len(conflicts))
+        by_cs = {p.callsign: p for p in planes}
+        for k, (ac1, ac2, risk) in enumerate(conflicts):
+            p1 = by_cs.get(ac1)
+            p2 = by_cs.get(ac2)
             if not p1 or not p2:
                 continue
 
-            turn_dir = "L" if random.random() < 0.5 else "R"
-            turn_deg = random.choice([10, 15, 20])
-            new_hdg = (p1.hdg + (turn_deg if turn_dir == "R" else -turn_deg)) % 360
+            turn_deg = int(turn_degs[k])
+            new_hdg = (p1.hdg + (turn_deg if turn_right[k] else -turn_deg)) % 360
             cmd = f"HDG {int(new_hdg):03d}"
             suggestions.append((p1.callsign, cmd))
         return suggestions
\ No newline at end of file
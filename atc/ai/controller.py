@@ -1,10 +1,11 @@
 import math
-import random
 import time
-from typing import List
+import numpy as np
+from typing import List, Optional
 
 from atc.objects.command import Command
-from .quadtree import Quadtree
+from .gridhash import GridHash
+from .snapshot import PlaneSnapshot
 from atc.utils import load_fixes, get_heading_to_fix, nm_to_px, calculate_layout
 from constants import (
     WIDTH, HEIGHT, SAFE_LAT_NM,
@@ -14,36 +15,49 @@ from constants import (
 )
 
 layout = calculate_layout(WIDTH, HEIGHT)
+_APPROACH_ARM_PX = nm_to_px(AI_APPROACH_ARM_DIST_NM)
+_SEPARATION_PX = nm_to_px(SAFE_LAT_NM * 0.8)
 
 class AIController:
     def __init__(self):
         self._fix_names = list(load_fixes(layout).keys()) or []
+        self.grid = GridHash()
+        self._nearby: List = []
+        self._rw_source: Optional[List] = None
+        self._rw_bearings = np.empty(0)
 
-    def update(self, planes: List, runways: List, dt: float):
-        if not planes:
+    def update(self, snapshot: PlaneSnapshot, runways: List, dt: float):
+        if not len(snapshot) or not snapshot.ai_mask.any():
             return
         
-        qt = Quadtree(0, 0, WIDTH, HEIGHT, cap=8, max_depth=8)
-        for p in planes:
-            qt.insert(p.x, p.y, p)
+        planes = snapshot.planes
+        grid = self.grid
+        grid.clear()
+        for x, y, p in zip(snapshot.x.tolist(), snapshot.y.tolist(), planes):
+            grid.insert(x, y, p)
         
-        now = time.time()
+        now = time.monotonic()
 
-        for ac in planes:
-            if not getattr(ac, "ai_controlled", False):
-                continue
+        due = [
+            (k, planes[k]) for k in np.flatnonzero(snapshot.ai_mask)
+            if now >= planes[k]._ai_next_decision
+        ]
+        if not due:
+            return
 
-            if now < getattr(ac, "_ai_next_decision", 0.0):
-                continue
+        coins = np.random.random(len(due))
+        fix_picks = np.random.randint(len(self._fix_names), size=len(due)) if self._fix_names else None
 
+        for k, (idx, ac) in enumerate(due):
             ac._ai_next_decision = now + AI_DECISION_PERIOD
 
-            nearby = qt.query_radius(ac.x, ac.y, nm_to_px(SAFE_LAT_NM * 0.8))
-            nearby = [o for o in nearby if o is not ac]
+            nearby = self._nearby
+            nearby.clear()
+            grid.query_radius(snapshot.x[idx], snapshot.y[idx], _SEPARATION_PX, out=nearby)
 
-            if nearby:
-                turn = AI_DECONFLICT_TURN * (1 if random.random() < 0.5 else -1)
-                new_hdg = int((ac.hdg + turn) % 180)
+            if any(o is not ac for o in nearby):
+                turn = AI_DECONFLICT_TURN * (1 if coins[k] < 0.5 else -1)
+                new_hdg = int((snapshot.hdg[idx] + turn) % 180)
                 ac.command_queue.append(Command("HDG", f"{new_hdg:03d}"))
                 continue
             
@@ -59,33 +73,34 @@ class AIController:
                 
                 continue
             
-            if self._fix_names:
-                fix = random.choice(self._fix_names)
+            if fix_picks is not None:
+                fix = self._fix_names[fix_picks[k]]
                 ac.command_queue.append(Command("NAV", fix))
 
+    def _runway_bearings(self, runways: List) -> np.ndarray:
+        if runways is not self._rw_source or len(runways) != len(self._rw_bearings):
+            self._rw_source = runways
+            self._rw_bearings = np.array([rw.bearing for rw in runways], dtype=float)
+        return self._rw_bearings
+
     def _choose_runway_for(self, ac, runways):
         if not runways:
             return None
         
-        candidates = []
-        for rw in runways:
-            if not rw.is_available():
-                continue
-            
-            diff = abs(((rw.bearing - ac.hdg) + 540) % 360 - 180)
-            if diff <= AI_ALIGN_ALLOWED_DIFF_DEG:
-                candidates.append((rw, diff))
+        bearings = self._runway_bearings(runways)
+        available = np.fromiter((rw.is_available() for rw in runways), dtype=bool, count=len(runways))
+        diffs = np.abs(((bearings - ac.hdg + 540) % 360) - 180)
+        diffs[~available] = np.inf
 
-        if not candidates:
+        best = int(np.argmin(diffs))
+        if diffs[best] > AI_ALIGN_ALLOWED_DIFF_DEG:
             return None
-        
-        candidates.sort(key=lambda t: t[1])
-        best_runway = candidates[0][0]
+        best_runway = runways[best]
 
         dx, dy = ac.x - best_runway.x, ac.y - best_runway.y
 
         dist_px = math.hypot(dx, dy)
-        if dist_px <= nm_to_px(AI_APPROACH_ARM_DIST_NM):
+        if dist_px <= _APPROACH_ARM_PX:
             return best_runway, best_runway.bearing
         
         return None
\ No newline at end of file
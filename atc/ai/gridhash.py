@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, Any, Optional
+import dataclasses
+
+from atc.utils import nm_to_px
+from constants import SAFE_LAT_NM
+
+@dataclasses.dataclass
+class GridHash:
+    """Uniform spatial hash over bounded airspace, sized to the AI separation radius."""
+    cell: float = nm_to_px(SAFE_LAT_NM * 0.8)
+    cells: Dict[Tuple[int, int], List[Tuple[float, float, Any]]] = dataclasses.field(default_factory=dict)
+
+    def _key(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell), int(y // self.cell)
+
+    def clear(self) -> None:
+        """Empty every cell while keeping the bucket lists for reuse."""
+        for bucket in self.cells.values():
+            bucket.clear()
+
+    def insert(self, x: float, y: float, obj: Any) -> bool:
+        self.cells.setdefault(self._key(x, y), []).append((x, y, obj))
+        return True
+
+    def query_radius(self, x: float, y: float, r: float, out: Optional[List[Any]] = None) -> List[Any]:
+        """Return all objects within radius `r` of point (x, y), appending to `out` if given."""
+        if out is None:
+            out = []
+        r2 = r * r
+        cx0, cy0 = self._key(x - r, y - r)
+        cx1, cy1 = self._key(x + r, y + r)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                out.extend(
+                    obj for px, py, obj in bucket
+                    if (px - x) * (px - x) + (py - y) * (py - y) <= r2
+                )
+        return out
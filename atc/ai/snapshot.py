@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import List, Any
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass
+class PlaneSnapshot:
+    """Per-tick structure-of-arrays copy of plane state for the AI consumers.
+
+    Index k in every array refers to `planes[k]`; the arrays are not updated
+    when the planes move, so build a fresh snapshot each frame. Numeric
+    arrays are float32, which is ample for pixel positions and feet.
+    """
+    planes: List[Any]
+    callsigns: List[str]
+    x: np.ndarray
+    y: np.ndarray
+    alt: np.ndarray
+    spd: np.ndarray
+    hdg: np.ndarray
+    ai_mask: np.ndarray
+
+    @classmethod
+    def build(cls, planes: List[Any]) -> PlaneSnapshot:
+        planes = list(planes)
+        n = len(planes)
+        return cls(
+            planes=planes,
+            callsigns=[p.callsign for p in planes],
+            x=np.fromiter((p.x for p in planes), dtype=np.float32, count=n),
+            y=np.fromiter((p.y for p in planes), dtype=np.float32, count=n),
+            alt=np.fromiter((p.alt for p in planes), dtype=np.float32, count=n),
+            spd=np.fromiter((p.spd for p in planes), dtype=np.float32, count=n),
+            hdg=np.fromiter((p.hdg for p in planes), dtype=np.float32, count=n),
+            ai_mask=np.fromiter((p.ai_controlled for p in planes), dtype=bool, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.planes)
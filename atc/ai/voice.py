@@ -1,50 +1,80 @@
 import queue
-import pyttsx3
 import threading
-from concurrent.futures import ThreadPoolExecutor
- 
-RESPONSE_VOICE_ENABLED = False
-
-def _create_engine():
-    engine = pyttsx3.init()
-    engine.setProperty("rate", 175)
-    engine.setProperty("volume", 0.9)
-    return engine
 
-def _speak_text(text: str):
-    try:
-        engine = _create_engine()
-        engine.say(text)
-        engine.runAndWait()
-        engine.stop()
-    except Exception:
-        pass
+RESPONSE_VOICE_ENABLED = False
+VOICE_QUEUE_SIZE = 8
 
-_executor = ThreadPoolExecutor(max_workers=3)
-_queue: "queue.Queue[str]" = queue.Queue()
+_queue: "queue.Queue[str | None]" = queue.Queue(maxsize=VOICE_QUEUE_SIZE)
+_engine = None
+_engine_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_thread_lock = threading.Lock()
 
 def set_voice_enabled(enabled: bool):
     global RESPONSE_VOICE_ENABLED
     RESPONSE_VOICE_ENABLED = enabled
 
-def _queue_worker():
+def _get_engine():
+    """Return the shared pyttsx3 engine, importing and initialising it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            try:
+                import pyttsx3
+                _engine = pyttsx3.init()
+                _engine.setProperty("rate", 175)
+                _engine.setProperty("volume", 0.9)
+            except Exception:
+                _engine = False
+        return _engine or None
+
+def _worker():
+    """Speak queued text sequentially on the shared engine."""
+    engine = _get_engine()
     while True:
         text = _queue.get()
         if text is None:
             break
-        if RESPONSE_VOICE_ENABLED and text.strip():
-            _executor.submit(_speak_text, text)
+        if engine is not None and RESPONSE_VOICE_ENABLED and text.strip():
+            try:
+                engine.say(text)
+                engine.runAndWait()
+            except Exception:
+                pass
         _queue.task_done()
 
-_thread = threading.Thread(target=_queue_worker, daemon=True)
-_thread.start()
+    if engine is not None:
+        engine.stop()
+
+def _ensure_worker():
+    global _thread
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_worker, daemon=True)
+            _thread.start()
 
 def speak(text: str):
-    """Queue text to be spoken asynchronously."""
+    """Queue text to be spoken asynchronously, dropping it if the queue is full."""
     if not RESPONSE_VOICE_ENABLED or not text:
         return
-    _queue.put(str(text))
+    _ensure_worker()
+    try:
+        _queue.put_nowait(str(text))
+    except queue.Full:
+        pass
 
 def shutdown():
-    _queue.put(None)
-    _executor.shutdown(wait=True)
\ No newline at end of file
+    if _thread is None:
+        return
+    # Drop pending speech so the stop marker never blocks on a full queue.
+    while True:
+        try:
+            _queue.get_nowait()
+        except queue.Empty:
+            break
+        _queue.task_done()
+    try:
+        _queue.put_nowait(None)
+    except queue.Full:
+        pass
+    _thread.join(timeout=2.0)
@@ -1,3 +1,4 @@
+import re
 from atc.objects.command import Command
 from atc.objects.runway_v2 import get_runway
 from atc.utils import convert_to_phraseology, get_callsign_from_iata
@@ -23,6 +24,10 @@ from constants import (
 )
 
 
+_SEG_RE = re.compile(r"[^|]+")
+_TOK_RE = re.compile(r"\S+")
+
+
 def _angle_diff(a: float, b: float) -> float:
     """Return the smallest angular difference between two headings."""
     return min((a - b) % 360, (b - a) % 360)
@@ -30,22 +35,32 @@ def _angle_diff(a: float, b: float) -> float:
 class CommandParser:
     """Handles parsing and processing of ATC-style commands."""
 
+    def __init__(self):
+        self._handlers = {
+            "C": self._handle_clearance,
+            "S": self._handle_speed,
+            "H": self._handle_hold,
+            "T": self._handle_takeoff,
+            "L": self._handle_landing,
+            "AI": self._handle_ai,
+        }
+
     def parse(self, text: str, planes):
         """Parse controller input string into executable aircraft commands."""
         if not text.strip():
             return [{"callsign": "", "ctrl_msg": MSG_NO_COMMAND, "ack_msg": MSG_NO_INPUT}]
 
-        segments = [seg.strip() for seg in text.split("|") if seg.strip()]
         results = []
+        by_cs = {p.callsign.upper(): p for p in planes}
 
-        for seg in segments:
+        for seg in _SEG_RE.findall(text.upper()):
             user_took_control = False
-            parts = seg.upper().split()
+            parts = _TOK_RE.findall(seg)
             if not parts:
                 continue
 
             callsign = parts[0]
-            aircraft = next((p for p in planes if p.callsign.upper() == callsign.upper()), None)
+            aircraft = by_cs.get(callsign)
 
             if not aircraft:
                 results.append({
@@ -80,76 +95,69 @@ class CommandParser:
         i = 0
 
         while i < len(tokens):
-            token = tokens[i]
-
-            if token == "C":
-                i += 1
-                if i >= len(tokens):
-                    break
-                arg = tokens[i]
-                extra = tokens[i + 1] if i + 1 < len(tokens) and tokens[i + 1] in CMD_TURN_TOKENS else None
-                if extra:
-                    i += 1
-
-                if arg.isdigit() and len(arg) == 3:
-                    cmds.append(Command("HDG", arg, extra))
-                    turn = "left " if extra == "L" else "right " if extra == "R" else ""
-                    ack_segments.append(f"turn {turn}heading {convert_to_phraseology(int(arg), 'heading')}")
-
-                elif arg.isdigit():
-                    cmds, ack = self._handle_altitude_command(aircraft, arg, extra)
-                    ack_segments.append(ack)
-
-                else:
-                    cmds.append(Command("NAV", arg, extra))
-                    ack_segments.append(f"cleared direct {arg}")
-
-            elif token == "S":
-                if i + 1 < len(tokens):
-                    spd = tokens[i + 1]
-                    cmds.append(Command("SPD", spd))
-                    ack_segments.append(f"speed {convert_to_phraseology(int(spd), 'speed')}")
-                    i += 1
-
-            elif token == "H":
-                fix = tokens[i + 1] if i + 1 < len(tokens) else None
-                cmds.append(Command("HOLD", fix))
-                ack_segments.append(MSG_HOLD_FIX.format(fix=fix) if fix else MSG_HOLD_POS)
-                if fix:
-                    i += 1
-
-            elif token == "T":
-                ack, new_cmds, skip = self._handle_takeoff(tokens, i, aircraft)
-                ack_segments.append(ack)
-                cmds.extend(new_cmds)
-                i += skip
-
-            elif token == "L":
-                ack, new_cmds, skip = self._handle_landing(tokens, i, aircraft)
-                ack_segments.append(ack)
-                cmds.extend(new_cmds)
-                i += skip
-
-            elif token == "AI":
-                mode = None
-                if i + 1 < len(tokens):
-                    nxt = tokens[i + 1]
-                    if nxt in ("ON", "OFF", "1", ):
-                        mode = nxt
-                        i += 1
-                if mode is None:
-                    aircraft.ai_controlled = not getattr(aircraft, "ai_controlled", False)
-                else:
-                    aircraft.ai_controlled = (mode in ("ON", "1"))
-                
-                ack_segments.append(f"AI {'enabled' if aircraft.ai_controlled else 'disabled'}")
-                i += 1
-                continue
-
+            handler = self._handlers.get(tokens[i])
+            if handler:
+                i += handler(tokens, i, aircraft, cmds, ack_segments)
             i += 1
 
         return cmds, ack_segments
 
+    def _handle_clearance(self, tokens, i, aircraft, cmds, ack_segments):
+        """Handle C <hdg|alt|fix> [turn/expedite] clearances."""
+        if i + 1 >= len(tokens):
+            return 1
+
+        arg = tokens[i + 1]
+        extra = tokens[i + 2] if i + 2 < len(tokens) and tokens[i + 2] in CMD_TURN_TOKENS else None
+
+        if arg.isdigit() and len(arg) == 3:
+            cmds.append(Command("HDG", arg, extra))
+            turn = "left " if extra == "L" else "right " if extra == "R" else ""
+            ack_segments.append(f"turn {turn}heading {convert_to_phraseology(int(arg), 'heading')}")
+
+        elif arg.isdigit():
+            alt_cmds, ack = self._handle_altitude_command(aircraft, arg, extra)
+            cmds.extend(alt_cmds)
+            ack_segments.append(ack)
+
+        else:
+            cmds.append(Command("NAV", arg, extra))
+            ack_segments.append(f"cleared direct {arg}")
+
+        return 2 if extra else 1
+
+    def _handle_speed(self, tokens, i, aircraft, cmds, ack_segments):
+        """Handle S <knots> speed assignments."""
+        if i + 1 >= len(tokens):
+            return 0
+
+        spd = tokens[i + 1]
+        cmds.append(Command("SPD", spd))
+        ack_segments.append(f"speed {convert_to_phraseology(int(spd), 'speed')}")
+        return 1
+
+    def _handle_hold(self, tokens, i, aircraft, cmds, ack_segments):
+        """Handle H [fix] holding instructions."""
+        fix = tokens[i + 1] if i + 1 < len(tokens) else None
+        cmds.append(Command("HOLD", fix))
+        ack_segments.append(MSG_HOLD_FIX.format(fix=fix) if fix else MSG_HOLD_POS)
+        return 1 if fix else 0
+
+    def _handle_ai(self, tokens, i, aircraft, cmds, ack_segments):
+        """Handle AI [ON|OFF|1] control toggles."""
+        mode = None
+        if i + 1 < len(tokens):
+            nxt = tokens[i + 1]
+            if nxt in ("ON", "OFF", "1", ):
+                mode = nxt
+        if mode is None:
+            aircraft.ai_controlled = not aircraft.ai_controlled
+        else:
+            aircraft.ai_controlled = (mode in ("ON", "1"))
+
+        ack_segments.append(f"AI {'enabled' if aircraft.ai_controlled else 'disabled'}")
+        return 1 if mode else 0
+
     def _handle_altitude_command(self, aircraft, arg, extra):
         """Process climb/descend commands."""
         target_alt = int(arg) * ALTITUDE_STEP_FT
@@ -175,8 +183,14 @@ class CommandParser:
 
         return [cmd], ack
 
-    def _handle_takeoff(self, tokens, i, aircraft):
+    def _handle_takeoff(self, tokens, i, aircraft, cmds, ack_segments):
         """Handle takeoff clearances."""
+        ack, new_cmds, skip = self._takeoff_clearance(tokens, i)
+        ack_segments.append(ack)
+        cmds.extend(new_cmds)
+        return skip
+
+    def _takeoff_clearance(self, tokens, i):
         if i + CMD_TAKEOFF_PARAMS_REQUIRED >= len(tokens):
             return MSG_TAKEOFF_MISSING_PARAMS, [], 0
 
@@ -193,8 +207,14 @@ class CommandParser:
         cmd = Command("TAKEOFF", f"{runway_name},{spd},{alt}")
         return MSG_TAKEOFF_CLEARANCE.format(rwy=runway_name, alt=alt, spd=spd), [cmd], CMD_TAKEOFF_PARAMS_REQUIRED
 
-    def _handle_landing(self, tokens, i, aircraft):
+    def _handle_landing(self, tokens, i, aircraft, cmds, ack_segments):
         """Handle landing clearances."""
+        ack, new_cmds, skip = self._landing_clearance(tokens, i, aircraft)
+        ack_segments.append(ack)
+        cmds.extend(new_cmds)
+        return skip
+
+    def _landing_clearance(self, tokens, i, aircraft):
         if i + 1 >= len(tokens):
             return MSG_LANDING_MISSING_RUNWAY, [], 0
 
@@ -1,12 +1,15 @@
-import math, dataclasses, time, random, json, os
-from typing import List, Optional, TYPE_CHECKING
+import math, dataclasses, random, json, os
+import numpy as np
+from collections import deque
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from atc.utils import (
     normalize_hdg, heading_to_vec, nm_to_px, calculate_layout,
-    get_heading_to_fix, distance_to_fix, load_fixes, shortest_turn_dir, px_to_nm
+    HEADING_VEC_LUT, heading_lut_index,
+    get_heading_to_fix, distance_to_fix_sq, load_fixes, px_to_nm
 )
 from atc.ai.voice import speak
 from constants import PLANE_TYPES
-from atc.utils import isa_density_at_alt_ft, interp_curve_xy
+from atc.utils import isa_density_at_alt_ft
 from constants import (
     WIDTH, HEIGHT, AIRLINES,
     DEFAULT_CLIMB_RATE_FPM, EXPEDITE_CLIMB_RATE_FPM,
@@ -23,12 +26,64 @@ from constants import (
     SPAWN_SPEEDS, SPAWN_ALTS, DEFAULT_DEST_ALT
 )
 from .command import Command
+from .flight_state import State
 from .runway_v2 import get_runway, get_airport, all_runways
 
 if TYPE_CHECKING:
     from .runway_v2 import Runway
 
-@dataclasses.dataclass
+# Simulation clock in seconds, advanced once per frame by update_fleet.
+SIM_TIME = 0.0
+_NOT_STARTED = -1.0
+
+# WIDTH/HEIGHT are fixed, so the world layout and scaled fixes never change.
+_LAYOUT = calculate_layout(WIDTH, HEIGHT)
+_FIXES = load_fixes(_LAYOUT)
+
+_decay_dt: Optional[float] = None
+_decay_step = 1.0
+
+def _stabilise_decay_step(dt: float) -> float:
+    """exp(-ALTITUDE_STABILISE_DECAY * dt), recomputed only when dt changes between calls."""
+    global _decay_dt, _decay_step
+    if dt != _decay_dt:
+        _decay_dt = dt
+        _decay_step = math.exp(-ALTITUDE_STABILISE_DECAY * dt)
+    return _decay_step
+
+_AIRLINE_CODES = tuple(a["IATA"] or a["ICAO"] for a in AIRLINES.values())
+
+_ALT_EASE_STEPS = 1024
+
+def _build_alt_ease_lut() -> List[float]:
+    """Sample the altitude easing curve (sine-shaped smoothstep) over t in [0, 1]."""
+    p = ALTITUDE_SMOOTHING_FACTOR
+    denom = math.sin(math.pi * 0.5 * p)
+    lut = []
+    for k in range(_ALT_EASE_STEPS + 1):
+        t = k / _ALT_EASE_STEPS
+        t_adj = (math.sin((t - 0.5) * math.pi * p) / denom + 1) / 2
+        lut.append(3 * t_adj**2 - 2 * t_adj**3)
+    return lut
+
+_ALT_EASE_LUT = _build_alt_ease_lut()
+
+def _alt_ease(t: float) -> float:
+    """Linearly interpolated lookup into the easing table for t in [0, 1]."""
+    pos = t * _ALT_EASE_STEPS
+    i = int(pos)
+    if i >= _ALT_EASE_STEPS:
+        return _ALT_EASE_LUT[-1]
+    a = _ALT_EASE_LUT[i]
+    return a + (_ALT_EASE_LUT[i + 1] - a) * (pos - i)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+@dataclasses.dataclass(slots=True)
 class PerformanceProfile:
     icao: str
     mass: dict
@@ -39,6 +94,41 @@ class PerformanceProfile:
     limits: dict = dataclasses.field(default_factory=dict)
     atmosphere: dict = dataclasses.field(default_factory=dict)
 
+    # Sorted (x, y) arrays for each curve and a flap-state -> cd table, built once per profile.
+    thrust_curve: Tuple[np.ndarray, np.ndarray] = dataclasses.field(init=False, repr=False)
+    fuel_curve: Tuple[np.ndarray, np.ndarray] = dataclasses.field(init=False, repr=False)
+    roc_curve: Tuple[np.ndarray, np.ndarray] = dataclasses.field(init=False, repr=False)
+    rod_curve: Tuple[np.ndarray, np.ndarray] = dataclasses.field(init=False, repr=False)
+    flap_cd: np.ndarray = dataclasses.field(init=False, repr=False)
+    # Scalars the physics step reads every tick, pulled out of the JSON dicts with their defaults applied.
+    empty_kg: float = dataclasses.field(init=False, repr=False)
+    base_cd: float = dataclasses.field(init=False, repr=False)
+    gear_cd: float = dataclasses.field(init=False, repr=False)
+    qnh_hpa: float = dataclasses.field(init=False, repr=False)
+    isa_deviation_c: float = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        thrust_pts = self.thrust.get("available", [])
+        thrust_key = next((k for k in thrust_pts[0].keys() if k.endswith("kn")), "thrust_kn") if thrust_pts else "thrust_kn"
+        self.thrust_curve = _curve_arrays(thrust_pts, "alt_ft", thrust_key)
+        self.fuel_curve = _curve_arrays(self.fuel.get("burn_kg_per_hr_vs_thrust", []), "thrust_pct", "kg_per_hr")
+        self.roc_curve = _curve_arrays(self.performance.get("roc_fpm_vs_weight", []), "weight_kg", "roc_fpm")
+        self.rod_curve = _curve_arrays(self.performance.get("rod_fpm_vs_weight", []), "weight_kg", "rod_fpm")
+
+        flaps = self.drag.get("flaps", [])
+        self.flap_cd = np.zeros(max((f.get("state", 0) for f in flaps), default=-1) + 1)
+        for f in reversed(flaps):
+            self.flap_cd[f.get("state", 0)] = f.get("cd", 0.0)
+
+        self.empty_kg = float(self.mass.get("empty_kg", 0))
+        self.base_cd = float(self.drag.get("base_cd", 0.03))
+        self.gear_cd = float(self.drag.get("gear_cd", 0.02))
+        self.qnh_hpa = float(self.atmosphere.get("qnh_hpa", 1013.25))
+        self.isa_deviation_c = float(self.atmosphere.get("isa_deviation_c", 0.0))
+
+    def flap_drag_cd(self, flap_state: int) -> float:
+        return float(self.flap_cd[flap_state]) if 0 <= flap_state < len(self.flap_cd) else 0.0
+
     @staticmethod
     def load_from_json(path: str) -> Optional["PerformanceProfile"]:
         try:
@@ -57,30 +147,101 @@ class PerformanceProfile:
         except Exception:
             return None
 
+def _curve_arrays(points: list, keyx: str, keyy: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted x/y arrays for np.interp; an empty curve interpolates to 0 everywhere."""
+    pts = sorted(points, key=lambda p: p[keyx])
+    if not pts:
+        return np.zeros(1), np.zeros(1)
+    return (
+        np.array([p[keyx] for p in pts], dtype=float),
+        np.array([p[keyy] for p in pts], dtype=float),
+    )
+
+def _physics_step(alt, spd, dest_alt, dest_spd, thrust_pct, weight_kg, fuel_kg, empty_kg, rho, cd,
+                  thrust_x, thrust_y, ff_x, ff_y, roc_x, roc_y, rod_x, rod_y, dt):
+    """Numeric core of Aircraft._physics_update; returns (alt, spd, thrust_pct, fuel_kg, weight_kg)."""
+    thrust_pct = max(0.0, min(100.0, thrust_pct + 0.5 * (dest_spd - spd) * dt))
+    thrust_kn = np.interp(alt, thrust_x, thrust_y) * (thrust_pct / 100.0)
+
+    # Quadratic drag; 122 m^2 is a typical narrowbody reference area
+    v_ms = max(0.0, spd) * 0.514444
+    drag_n = 0.5 * rho * (v_ms ** 2) * cd * 122.0
+    acc_ms2 = (thrust_kn * 1000.0 - drag_n) / max(1.0, weight_kg)
+    acc_ms2 = max(-5.0, min(5.0, acc_ms2))
+    spd = max(0.0, spd + (acc_ms2 * 1.94384) * dt)
+
+    if abs(dest_alt - alt) > 50:
+        if dest_alt > alt:
+            vs_fpm = np.interp(weight_kg, roc_x, roc_y)
+        else:
+            vs_fpm = -np.interp(weight_kg, rod_x, rod_y)
+    else:
+        vs_fpm = 0.0
+
+    alt += vs_fpm * dt / 60.0
+    if (vs_fpm > 0 and alt > dest_alt) or (vs_fpm < 0 and alt < dest_alt):
+        alt = dest_alt
+
+    fuel_kg = max(0.0, fuel_kg - np.interp(thrust_pct, ff_x, ff_y) * dt / 3600.0)
+    return float(alt), float(spd), float(thrust_pct), float(fuel_kg), float(empty_kg + fuel_kg)
+
+if NUMBA_AVAILABLE:
+    try:
+        _physics_step = njit(
+            "UniTuple(float64, 5)(" + ", ".join(["float64"] * 10 + ["float64[:]"] * 8 + ["float64"]) + ")",
+            cache=True, fastmath=True,
+        )(_physics_step)
+    except Exception:
+        # Frozen builds ship this module without source, so numba has no cache locator; keep the Python step.
+        pass
+
 class PhysicsEngine:
     def __init__(self, profile: PerformanceProfile):
         self.p = profile
 
     def available_thrust_kn(self, alt_ft: float) -> float:
-        pts = self.p.thrust.get("available", [])
-        if not pts:
-            return 0.0
-        thrust_key = next((k for k in pts[0].keys() if k.endswith("kn")), "thrust_kn")
-        return interp_curve_xy(pts, alt_ft, "alt_ft", thrust_key) or 0.0
+        return float(np.interp(alt_ft, *self.p.thrust_curve))
 
     def fuel_flow_kg_per_hr(self, thrust_pct: float) -> float:
-        pts = self.p.fuel.get("burn_kg_per_hr_vs_thrust", [])
-        return interp_curve_xy(pts, thrust_pct, "thrust_pct", "kg_per_hr") or 0.0
+        return float(np.interp(thrust_pct, *self.p.fuel_curve))
 
     def roc_fpm(self, weight_kg: float) -> float:
-        pts = self.p.performance.get("roc_fpm_vs_weight", [])
-        return interp_curve_xy(pts, weight_kg, "weight_kg", "roc_fpm") or 0.0
+        return float(np.interp(weight_kg, *self.p.roc_curve))
 
     def rod_fpm(self, weight_kg: float) -> float:
-        pts = self.p.performance.get("rod_fpm_vs_weight", [])
-        return interp_curve_xy(pts, weight_kg, "weight_kg", "rod_fpm") or 0.0
+        return float(np.interp(weight_kg, *self.p.rod_curve))
+
+_PERF_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "performance"))
+_PROFILE_CACHE: dict[str, Optional[PerformanceProfile]] = {}
+_ENGINE_CACHE: dict[str, PhysicsEngine] = {}
+
+def _get_profile(aircraft_type: str) -> Optional[PerformanceProfile]:
+    """Resolve and parse the profile JSON for a type once; later calls reuse the shared result."""
+    if aircraft_type in _PROFILE_CACHE:
+        return _PROFILE_CACHE[aircraft_type]
+
+    path = os.path.join(_PERF_DIR, f"{aircraft_type}.json")
+
+    # Case-insensitive fallback
+    if not os.path.isfile(path):
+        lower_path = os.path.join(_PERF_DIR, f"{aircraft_type.lower()}.json")
+        if os.path.isfile(lower_path):
+            path = lower_path
+
+    profile = None
+    if os.path.isfile(path):
+        profile = PerformanceProfile.load_from_json(path)
+        if profile:
+            _ENGINE_CACHE[aircraft_type] = PhysicsEngine(profile)
+        else:
+            print(f"[WARN] Failed to parse JSON for {aircraft_type}")
+    else:
+        print(f"[WARN] No JSON found for {aircraft_type} at {path}")
+
+    _PROFILE_CACHE[aircraft_type] = profile
+    return profile
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Aircraft:
     callsign: str
     x: float
@@ -92,7 +253,7 @@ class Aircraft:
     aircraft_type: Optional[str] = None
     ai_controlled: bool = False
     dest_hdg: Optional[float] = None
-    state: str = "AIRBORNE"
+    state: State = State.AIRBORNE
     turn_dir_forced: Optional[str] = None
     climb_rate: int = DEFAULT_CLIMB_RATE_FPM
     expedite: bool = False
@@ -104,64 +265,60 @@ class Aircraft:
     hold_timer: float = 0.0
     current_runway: Optional["Runway"] = None
     touchdown_time: Optional[float] = None
-    hold_timer: float = 0.0
     pending_command_timer: float = 0.0
     on_runway: bool = False
     assigned_runway: Optional["Runway"] = None
-    altitude_history: list = dataclasses.field(default_factory=list)
+    altitude_history: deque = dataclasses.field(default_factory=deque)
     history_timer: float = 0.0
     HISTORY_INTERVAL: float = 1.0
     HISTORY_LIMIT_S: float = 600.0 
 
     _alt_start: float = dataclasses.field(init=False, default=0)
     _alt_target: float = dataclasses.field(init=False, default=0)
-    _alt_start_time: Optional[float] = dataclasses.field(init=False, default=None)
+    # Sim-time stamps; _NOT_STARTED means no altitude transition or settle is running.
+    _alt_start_time: float = dataclasses.field(init=False, default=_NOT_STARTED)
     _alt_duration: float = dataclasses.field(init=False, default=0.0)
-    _alt_stabilise_start: Optional[float] = dataclasses.field(init=False, default=None)
+    _alt_stabilise_start: float = dataclasses.field(init=False, default=_NOT_STARTED)
+    _alt_decay: float = dataclasses.field(init=False, default=1.0)
+    # +1 / -1 for a forced right / left turn, 0 for shortest; set with turn_dir_forced.
+    _turn_sign: int = dataclasses.field(init=False, default=0)
     _ai_next_decision: float = 0.0
+
+    # Set from the performance profile in __post_init__ when one loads.
+    _use_new_physics: bool = dataclasses.field(init=False, default=False)
+    _perf_profile: Optional[PerformanceProfile] = dataclasses.field(init=False, default=None)
+    _physics: Optional[PhysicsEngine] = dataclasses.field(init=False, default=None)
+    fuel_capacity_kg: float = dataclasses.field(init=False, default=0.0)
+    fuel_kg: float = dataclasses.field(init=False, default=0.0)
+    weight_kg: float = dataclasses.field(init=False, default=0.0)
+    flap_state: int = dataclasses.field(init=False, default=0)
+    gear_down: bool = dataclasses.field(init=False, default=False)
+    thrust_pct: float = dataclasses.field(init=False, default=0.0)
+    icao: str = dataclasses.field(init=False, default="UNKNOWN")
+    # Air density at _rho_alt; cruising aircraft hold altitude exactly, so this rarely changes.
+    _rho_alt: float = dataclasses.field(init=False, default=math.nan)
+    _rho: float = dataclasses.field(init=False, default=0.0)
     
     def __post_init__(self):
         self._alt_start = self.alt
         self._alt_target = self.dest_alt
 
         # === Load aircraft performance profile ===
-        self._use_new_physics = False
-        self.aircraft_type = getattr(self, "aircraft_type", None)
-
         try:
             if self.aircraft_type:
-                # Build absolute path relative to this file
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-                perf_dir = os.path.abspath(os.path.join(base_dir, "..", "..", "data", "performance"))
-                path = os.path.join(perf_dir, f"{self.aircraft_type}.json")
-
-                # Case-insensitive fallback
-                if not os.path.isfile(path):
-                    lower_path = os.path.join(perf_dir, f"{self.aircraft_type.lower()}.json")
-                    if os.path.isfile(lower_path):
-                        path = lower_path
-
-                if os.path.isfile(path):
-                    profile = PerformanceProfile.load_from_json(path)
-                    if profile:
-                        self._perf_profile = profile
-                        self._physics = PhysicsEngine(profile)
-
-                        # --- Runtime parameters ---
-                        empty_kg = profile.mass.get("empty_kg", 0)
-                        self.fuel_capacity_kg = profile.mass.get("fuel_capacity_kg", 10000)
-                        self.fuel_kg = min(self.fuel_capacity_kg, 0.5 * self.fuel_capacity_kg)
-                        self.weight_kg = empty_kg + self.fuel_kg
-                        self.flap_state = 0
-                        self.gear_down = False
-                        self.thrust_pct = 60.0
-                        self.icao = profile.icao
-                        self._use_new_physics = True
-                        print(f"[INFO] Loaded performance profile for {self.aircraft_type}")
-                    else:
-                        print(f"[WARN] Failed to parse JSON for {self.aircraft_type}")
-                else:
-                    print(f"[WARN] No JSON found for {self.aircraft_type} at {path}")
+                profile = _get_profile(self.aircraft_type)
+                if profile:
+                    self._perf_profile = profile
+                    self._physics = _ENGINE_CACHE[self.aircraft_type]
+
+                    # --- Runtime parameters ---
+                    self.fuel_capacity_kg = profile.mass.get("fuel_capacity_kg", 10000)
+                    self.fuel_kg = min(self.fuel_capacity_kg, 0.5 * self.fuel_capacity_kg)
+                    self.weight_kg = profile.empty_kg + self.fuel_kg
+                    self.thrust_pct = 60.0
+                    self.icao = profile.icao
+                    self._use_new_physics = True
+                    print(f"[INFO] Loaded performance profile for {self.aircraft_type}")
             else:
                 print(f"[WARN] Aircraft type not set for {self.callsign}")
         except Exception as e:
@@ -170,99 +327,121 @@ class Aircraft:
     def set_altitude_target(self, target_alt: int):
         self._alt_start = self.alt
         self._alt_target = target_alt
-        self._alt_start_time = time.time()
+        self._alt_start_time = SIM_TIME
 
         delta = abs(target_alt - self.alt)
         max_climb_rate = DEFAULT_CLIMB_RATE_FPM if not self.expedite else EXPEDITE_CLIMB_RATE_FPM
-        self._alt_duration = max(ALTITUDE_INTERPOLATION_MIN_DURATION, (delta / 1000) * 0.5) if delta > 0 else 1.0
-        self._alt_stabilise_start = None
+        self._alt_duration = max(ALTITUDE_INTERPOLATION_MIN_DURATION, (delta / 1000) * 0.5 if delta > 0 else 1.0)
+        self._alt_stabilise_start = _NOT_STARTED
 
     def execute_command(self, cmd: Command, dt) -> bool:
-        layout = calculate_layout(WIDTH, HEIGHT)
         assert cmd.value is not None
-        if cmd.type == "ALT":
-            if cmd.value.isdigit():
-                self.dest_alt = int(cmd.value) * 1000
-                self.expedite = cmd.extra in ("X", "EX")
-            else:
-                self.msg = f"{self.callsign}: invalid altitude '{cmd.value}'"
-            
-            return True
+        handler = self._COMMAND_HANDLERS.get(cmd.type)
+        return handler(self, cmd) if handler else True
 
-        elif cmd.type == "HDG":
-            if cmd.value.isdigit():
-                self.dest_hdg = int(cmd.value)
-                self.turn_dir_forced = cmd.extra
-            else:
-                self.msg = f"{self.callsign}: invalid heading '{cmd.value}'"
-            return True
+    def _handle_alt(self, cmd: Command) -> bool:
+        if cmd.value.isdigit():
+            self.dest_alt = int(cmd.value) * 1000
+            self.expedite = cmd.extra in ("X", "EX")
+        else:
+            self.msg = f"{self.callsign}: invalid altitude '{cmd.value}'"
+        return True
 
-        elif cmd.type == "SPD":
-            if cmd.value.isdigit():
-                self.dest_spd = int(cmd.value)
-            else:
-                self.msg = f"{self.callsign}: invalid speed '{cmd.value}'"
-            return True
+    def _handle_hdg(self, cmd: Command) -> bool:
+        if cmd.value.isdigit():
+            self.dest_hdg = int(cmd.value)
+            self.turn_dir_forced = cmd.extra
+            self._turn_sign = _FORCED_TURN_SIGN.get(cmd.extra, 0)
+        else:
+            self.msg = f"{self.callsign}: invalid heading '{cmd.value}'"
+        return True
 
-        elif cmd.type == "HOLD":
-            self.holding = True
-            self.hold_center = (self.x, self.y)
-            self.msg = f"{self.callsign} HOLDING"
-            return True
+    def _handle_spd(self, cmd: Command) -> bool:
+        if cmd.value.isdigit():
+            self.dest_spd = int(cmd.value)
+        else:
+            self.msg = f"{self.callsign}: invalid speed '{cmd.value}'"
+        return True
 
-        elif cmd.type == "NAV":
-            fixes = load_fixes(layout)
-            if cmd.value not in fixes:
-                self.msg = f"UNKNOWN FIX {cmd.value}"
-                return True
-            fix = fixes[cmd.value]
-            hdg = get_heading_to_fix(self, fix)
-            self.dest_hdg = hdg
-            self.msg = f"{self.callsign} CLEARED TO {cmd.value}"
-            if distance_to_fix(self, fix) < 12:
-                self.msg = f"{self.callsign} ARRIVED {cmd.value}"
+    def _handle_hold(self, cmd: Command) -> bool:
+        self.holding = True
+        self.hold_center = (self.x, self.y)
+        self.msg = f"{self.callsign} HOLDING"
+        return True
+
+    def _handle_nav(self, cmd: Command) -> bool:
+        fix = _FIXES.get(cmd.value)
+        if fix is None:
+            self.msg = f"UNKNOWN FIX {cmd.value}"
             return True
+        hdg = get_heading_to_fix(self, fix)
+        self.dest_hdg = hdg
+        self.msg = f"{self.callsign} CLEARED TO {cmd.value}"
+        if distance_to_fix_sq(self, fix) < 12 * 12:
+            self.msg = f"{self.callsign} ARRIVED {cmd.value}"
+        return True
 
-        elif cmd.type == "TAKEOFF":
-            runway_name, spd, alt = cmd.value.split(",")
-            rw = get_runway(runway_name)
-            if not rw:
-                self.msg = f"Runway {runway_name} not found"
-                return True
-            if not rw.is_available():
-                self.msg = f"{runway_name} occupied"
-                return True
-
-            rw.occupy(self)
-            self.current_runway = rw
-            self.state = "TAKEOFF"
-            self.dest_spd = int(spd)
-            self.dest_alt = int(alt)
-            self.dest_hdg = rw.bearing
-            self.msg = f"{self.callsign} rolling {rw.name}"
+    def _handle_takeoff(self, cmd: Command) -> bool:
+        runway_name, spd, alt = cmd.value.split(",")
+        rw = get_runway(runway_name)
+        if not rw:
+            self.msg = f"Runway {runway_name} not found"
+            return True
+        if not rw.is_available():
+            self.msg = f"{runway_name} occupied"
             return True
 
-        elif cmd.type == "LAND":
-            rw = get_runway(cmd.value)
-            if not rw:
-                self.msg = f"Runway {cmd.value} not found"
-                return True
-            if not rw.is_available():
-                self.msg = f"{rw.name} occupied"
-                return True
-
-            rw.occupy(self)
-            self.current_runway = rw
-            self.state = "LANDING"
-            self.dest_hdg = rw.bearing
-            self.dest_spd = 160
-            self.set_altitude_target(0)
-            self.msg = f"{self.callsign} landing {rw.name}"
+        rw.occupy(self)
+        self.current_runway = rw
+        self.state = State.TAKEOFF
+        self.dest_spd = int(spd)
+        self.dest_alt = int(alt)
+        self.dest_hdg = rw.bearing
+        self.msg = f"{self.callsign} rolling {rw.name}"
+        return True
+
+    def _handle_land(self, cmd: Command) -> bool:
+        rw = get_runway(cmd.value)
+        if not rw:
+            self.msg = f"Runway {cmd.value} not found"
+            return True
+        if not rw.is_available():
+            self.msg = f"{rw.name} occupied"
             return True
 
+        rw.occupy(self)
+        self.current_runway = rw
+        self.state = State.LANDING
+        self.dest_hdg = rw.bearing
+        self.dest_spd = 160
+        self.set_altitude_target(0)
+        self.msg = f"{self.callsign} landing {rw.name}"
         return True
 
+    _COMMAND_HANDLERS = {
+        "ALT": _handle_alt,
+        "HDG": _handle_hdg,
+        "SPD": _handle_spd,
+        "HOLD": _handle_hold,
+        "NAV": _handle_nav,
+        "TAKEOFF": _handle_takeoff,
+        "LAND": _handle_land,
+    }
+
     def update(self, dt):
+        if self._advance(dt):
+            if self.dest_hdg is not None:
+                self.turn_towards(self.dest_hdg, dt)
+            dx, dy = heading_to_vec(self.hdg)
+            pxps = nm_to_px(self.spd / 3600.0)
+            self.x += dx * pxps * dt
+            self.y += dy * pxps * dt
+
+    def _advance(self, dt) -> bool:
+        """Run one tick of everything except the heading turn and position integration.
+
+        Returns False when the aircraft is held in place this tick.
+        """
         if self.command_queue:
             current = self.command_queue[0]
 
@@ -271,288 +450,301 @@ class Aircraft:
             else:
                 self.pending_command_timer -= dt
                 if self.pending_command_timer > 0:
-                    return
+                    return False
 
             done = self.execute_command(current, dt)
             if done:
                 self.command_queue.pop(0)
                 self.pending_command_timer = 0.0
 
-        if self.on_runway and self.state in ("TAKEOFF_PENDING", "ON_RUNWAY"):
+        if (
+            self.state == State.AIRBORNE
+            and not self._use_new_physics
+            and self._alt_start_time < 0
+            and self.alt == self.dest_alt
+            and (self.dest_spd is None or self.spd == self.dest_spd)
+        ):
+            # Level and on speed with no profile: nothing below would change this tick.
+            return True
+
+        if self.on_runway and self.state in (State.TAKEOFF_PENDING, State.ON_RUNWAY):
             self.alt = RUNWAY_SPAWN_ALT_FT
             self.spd = 0
-            return
+            return False
 
-        if self._alt_start_time is not None:
-            elapsed = time.time() - self._alt_start_time
-            self._alt_duration = max(self._alt_duration, ALTITUDE_INTERPOLATION_MIN_DURATION)
+        if self._alt_start_time >= 0:
+            elapsed = SIM_TIME - self._alt_start_time
             t = min(elapsed / self._alt_duration, 1.0)
-            p = ALTITUDE_SMOOTHING_FACTOR
-            t_adj = (math.sin((t - 0.5) * math.pi * p) / math.sin(math.pi * 0.5 * p) + 1) / 2
-            factor = 3 * t_adj**2 - 2 * t_adj**3
+            factor = _alt_ease(t)
             self.alt = self._alt_start + (self._alt_target - self._alt_start) * factor
 
             if t >= 1.0:
-                if self._alt_stabilise_start is None:
-                    self._alt_stabilise_start = time.time()
-                elapsed_since = time.time() - self._alt_stabilise_start
-                decay = math.exp(-elapsed_since * ALTITUDE_STABILISE_DECAY)
+                if self._alt_stabilise_start < 0:
+                    self._alt_stabilise_start = SIM_TIME
+                    self._alt_decay = 1.0
+                else:
+                    self._alt_decay *= _stabilise_decay_step(dt)
+                decay = self._alt_decay
+                elapsed_since = SIM_TIME - self._alt_stabilise_start
                 offset = math.sin(elapsed_since * ALTITUDE_STABILISE_FREQ) * ALTITUDE_STABILISE_AMPLITUDE * decay
                 self.alt = self._alt_target + offset
                 if decay < ALTITUDE_STABILISE_END_THRESHOLD:
                     self.alt = self._alt_target
-                    self._alt_start_time = None
-                    self._alt_stabilise_start = None
+                    self._alt_start_time = _NOT_STARTED
+                    self._alt_stabilise_start = _NOT_STARTED
         else:
-            rate = self.climb_rate * (2 if self.expedite else 1)
-            if self.alt < self.dest_alt:
-                self.alt = min(self.dest_alt, self.alt + rate * dt / 60)
-            elif self.alt > self.dest_alt:
-                self.alt = max(self.dest_alt, self.alt - rate * dt / 60)
-
-        if self.dest_hdg is not None:
-            self.turn_towards(self.dest_hdg, dt)
+            step = self.climb_rate * (2 if self.expedite else 1) * dt / 60
+            self.alt += max(-step, min(step, self.dest_alt - self.alt))
 
-        if self.dest_spd is not None and not getattr(self, "_use_new_physics", False):
-            diff = self.dest_spd - self.spd
-            self.spd += max(min(diff, SPEED_CHANGE_RATE_KTS_PER_SEC * dt), -SPEED_CHANGE_RATE_KTS_PER_SEC * dt)
+        use_new_physics = self._use_new_physics
+        if self.dest_spd is not None and not use_new_physics:
+            spd_step = SPEED_CHANGE_RATE_KTS_PER_SEC * dt
+            self.spd += max(-spd_step, min(spd_step, self.dest_spd - self.spd))
 
-        if getattr(self, "_use_new_physics", False):
+        if use_new_physics:
             self._physics_update(dt)
 
-        if self.state in ("LANDING", "LANDED") and self.alt <= 20:
+        if self.state >= State.LANDING and self.alt <= 20:
             self.spd = max(0, self.spd - LANDING_DECEL_RATE_KTS_PER_SEC * dt)
 
-        dx, dy = heading_to_vec(self.hdg)
-        nmps = self.spd / 3600.0
-        pxps = nm_to_px(nmps)
-        self.x += dx * pxps * dt
-        self.y += dy * pxps * dt
-
         if self.current_runway:
-            if self.state == "TAKEOFF":
+            if self.state == State.TAKEOFF:
                 if self.alt >= TAKEOFF_RELEASE_ALT_FT or (
                     self.dest_alt > 0 and self.alt > TAKEOFF_RELEASE_RATIO * self.dest_alt
                 ):
                     self.current_runway.release()
                     self.current_runway = None
-                    self.state = "AIRBORNE"
+                    self.state = State.AIRBORNE
 
-            elif self.state == "LANDING" and self.alt <= LANDING_TOUCHDOWN_ALT_FT:
+            elif self.state == State.LANDING and self.alt <= LANDING_TOUCHDOWN_ALT_FT:
                 airport = get_airport()
                 assert airport is not None
                 airport.register_arrival(self)
 
                 if self.touchdown_time is None:
-                    self.touchdown_time = time.time()
+                    self.touchdown_time = SIM_TIME
 
                 if self.spd < LANDING_ROLLOUT_MIN_SPEED or (
-                    time.time() - self.touchdown_time > LANDING_ROLLOUT_MAX_TIME
+                    SIM_TIME - self.touchdown_time > LANDING_ROLLOUT_MAX_TIME
                 ):
-                    self.state = "LANDED"
-                    if getattr(self, "current_runway", None):
+                    self.state = State.LANDED
+                    if self.current_runway:
                         if self.current_runway.active_aircraft == self:
                             self.current_runway.release()
                         self.current_runway = None
 
-        if getattr(self, "_use_new_physics", False):
+        if use_new_physics:
             self.history_timer += dt
             if self.history_timer >= self.HISTORY_INTERVAL:
                 self.history_timer = 0.0
-                self.altitude_history.append((time.time(), self.alt))
+                history = self.altitude_history
+                history.append((SIM_TIME, self.alt))
                 # Trim history older than HISTORY_LIMIT_S
-                cutoff = time.time() - self.HISTORY_LIMIT_S
-                self.altitude_history = [
-                    (t, a) for (t, a) in self.altitude_history if t >= cutoff
-                ]
-
-    def _physics_update(self, dt: float):
-        target_spd = self.dest_spd if self.dest_spd is not None else self.spd
-        spd_err = (target_spd - self.spd)
-        self.thrust_pct = max(0.0, min(100.0, getattr(self, "thrust_pct", 60.0) + 0.5 * spd_err * dt))
-
-        # Atmosphere & thrust
-        qnh = self._perf_profile.atmosphere.get("qnh_hpa", 1013.25)
-        isa_dev = self._perf_profile.atmosphere.get("isa_deviation_c", 0.0)
-        rho = isa_density_at_alt_ft(self.alt, qnh, isa_dev)
-
-        thrust_available_kn = self._physics.available_thrust_kn(self.alt)
-        thrust_kn = thrust_available_kn * (self.thrust_pct / 100.0)
-
-        # Drag (quadratic) with flap/gear modifiers
-        base_cd = self._perf_profile.drag.get("base_cd", 0.03)
-        gear_cd = self._perf_profile.drag.get("gear_cd", 0.02) if getattr(self, "gear_down", False) else 0.0
-        flap_cd = 0.0
-        for f in self._perf_profile.drag.get("flaps", []):
-            if f.get("state") == getattr(self, "flap_state", 0):
-                flap_cd = f.get("cd", 0.0)
-                break
-        cd = base_cd + gear_cd + flap_cd
-
-        # Convert speed (kts) to m/s
-        v_ms = max(0.0, self.spd) * 0.514444
-        area_ref = 122.0  # m^2 typical narrowbody; tune per-type in future
-        drag_n = 0.5 * rho * (v_ms ** 2) * cd * area_ref
-        thrust_n = thrust_kn * 1000.0
-
-        # Longitudinal acceleration (very simplified)
-        acc_ms2 = (thrust_n - drag_n) / max(1.0, self.weight_kg)
-        acc_ms2 = max(-5.0, min(5.0, acc_ms2))  # clamp to keep sim stable
-
-        # Update speed (m/s -> kts)
-        self.spd = max(0.0, self.spd + (acc_ms2 * 1.94384) * dt)
-
-        # Vertical rate from performance tables based on current weight and target altitude
-        if self.dest_alt is not None and abs(self.dest_alt - self.alt) > 50:
-            climbing = self.dest_alt > self.alt
-            if climbing:
-                vs_fpm = self._physics.roc_fpm(self.weight_kg)
-            else:
-                vs_fpm = -self._physics.rod_fpm(self.weight_kg)
-        else:
-            vs_fpm = 0.0
+                cutoff = SIM_TIME - self.HISTORY_LIMIT_S
+                while history[0][0] < cutoff:
+                    history.popleft()
 
-        # Integrate altitude and clamp to target if overshoot
-        self.alt += vs_fpm * dt / 60.0
-        if (vs_fpm > 0 and self.alt > self.dest_alt) or (vs_fpm < 0 and self.alt < self.dest_alt):
-            self.alt = float(self.dest_alt)
-
-        # Fuel burn
-        ff_kg_hr = self._physics.fuel_flow_kg_per_hr(self.thrust_pct)
-        burned = ff_kg_hr * dt / 3600.0
-        self.fuel_kg = max(0.0, self.fuel_kg - burned)
+        return True
 
-        # Update gross weight
-        empty_kg = self._perf_profile.mass.get("empty_kg", 0)
-        self.weight_kg = empty_kg + self.fuel_kg
+    def _physics_update(self, dt: float):
+        prof = self._perf_profile
+        if self.alt != self._rho_alt:
+            self._rho_alt = self.alt
+            self._rho = isa_density_at_alt_ft(self.alt, prof.qnh_hpa, prof.isa_deviation_c)
+        cd = prof.base_cd + (prof.gear_cd if self.gear_down else 0.0) + prof.flap_drag_cd(self.flap_state)
+        self.alt, self.spd, self.thrust_pct, self.fuel_kg, self.weight_kg = _physics_step(
+            float(self.alt), float(self.spd),
+            float(self.dest_alt), float(self.dest_spd if self.dest_spd is not None else self.spd),
+            float(self.thrust_pct), float(self.weight_kg), float(self.fuel_kg),
+            prof.empty_kg, self._rho, cd,
+            *prof.thrust_curve, *prof.fuel_curve, *prof.roc_curve, *prof.rod_curve,
+            float(dt),
+        )
 
     def turn_towards(self, tgt, dt):
         cur = normalize_hdg(self.hdg)
         tgt = normalize_hdg(tgt)
-        sign = (
-            1 if self.turn_dir_forced == "R"
-            else -1 if self.turn_dir_forced == "L"
-            else shortest_turn_dir(cur, tgt)
-        )
-        diff = abs((tgt - cur + 360) % 360)
-        self.hdg = tgt if diff < TURN_RATE_DEG_PER_SEC * dt else normalize_hdg(
-            self.hdg + sign * TURN_RATE_DEG_PER_SEC * dt
-        )
+        # Signed shortest difference in (-180, 180]; a 180 degree reversal turns right.
+        signed_diff = 180 - (cur - tgt + 540) % 360
+        sign = self._turn_sign or (1 if signed_diff >= 0 else -1)
+        step = TURN_RATE_DEG_PER_SEC * dt
+        self.hdg = tgt if abs(signed_diff) < step else normalize_hdg(self.hdg + sign * step)
 
     def distance_nm(self, other):
-        dx, dy = self.x - other.x, self.y - other.y
-        return px_to_nm(math.sqrt(dx * dx + dy * dy))
+        return px_to_nm(math.hypot(self.x - other.x, self.y - other.y))
 
     def vert_sep(self, other):
         return abs(self.alt - other.alt)
 
 
+def _position_deltas_np(hdg_idx: np.ndarray, spd: np.ndarray, px_per_kt: float):
+    vec = HEADING_VEC_LUT[hdg_idx]
+    step = spd * px_per_kt
+    return vec[:, 0] * step, vec[:, 1] * step
+
+def _position_deltas_loop(hdg_idx, spd, px_per_kt):
+    n = hdg_idx.shape[0]
+    dx = np.empty(n)
+    dy = np.empty(n)
+    for k in range(n):
+        step = spd[k] * px_per_kt
+        dx[k] = HEADING_VEC_LUT[hdg_idx[k], 0] * step
+        dy[k] = HEADING_VEC_LUT[hdg_idx[k], 1] * step
+    return dx, dy
+
+_position_deltas = _position_deltas_np
+if NUMBA_AVAILABLE:
+    try:
+        # Eager signature: compiled (or loaded from the on-disk cache) at import, not on the first frame.
+        _position_deltas = njit(
+            "UniTuple(float64[:], 2)(intp[:], float64[:], float64)", cache=True, fastmath=True,
+        )(_position_deltas_loop)
+    except Exception:
+        # e.g. a frozen build ships this module without source, so numba has no cache locator.
+        pass
+
+_FORCED_TURN_SIGN = {"R": 1, "L": -1}
+
+def _turn_headings(hdg: np.ndarray, tgt: np.ndarray, forced: np.ndarray, step: float) -> np.ndarray:
+    """Array form of Aircraft.turn_towards; `forced` is +1/-1 for R/L or 0 for shortest."""
+    cur = hdg % 360
+    tgt = tgt % 360
+    signed_diff = 180 - (cur - tgt + 540) % 360
+    sign = np.where(forced != 0, forced, np.where(signed_diff >= 0, 1.0, -1.0))
+    return np.where(np.abs(signed_diff) < step, tgt, (hdg + sign * step) % 360)
+
+def update_fleet(planes: List[Aircraft], dt: float) -> None:
+    """Advance every aircraft one tick, turning and moving them in single array passes."""
+    global SIM_TIME
+    SIM_TIME += dt
+    movers = [p for p in planes if p._advance(dt)]
+    if not movers:
+        return
+
+    n = len(movers)
+    hdg = np.fromiter((p.hdg for p in movers), dtype=float, count=n)
+    spd = np.fromiter((p.spd for p in movers), dtype=float, count=n)
+
+    turning = [k for k, p in enumerate(movers) if p.dest_hdg is not None]
+    if turning:
+        turned = _turn_headings(
+            hdg[turning],
+            np.array([movers[k].dest_hdg for k in turning], dtype=float),
+            np.array([movers[k]._turn_sign for k in turning], dtype=float),
+            TURN_RATE_DEG_PER_SEC * dt,
+        )
+        hdg[turning] = turned
+        for k, h in zip(turning, turned.tolist()):
+            movers[k].hdg = h
+
+    dxs, dys = _position_deltas(heading_lut_index(hdg), spd, nm_to_px(dt / 3600.0))
+    for p, dx, dy in zip(movers, dxs.tolist(), dys.tolist()):
+        p.x += dx
+        p.y += dy
+
+
+_RADAR_WIDTH = _LAYOUT["RADAR_WIDTH"]
+_RADAR_HEIGHT = _LAYOUT["RADAR_HEIGHT"]
+_SPAWN_MARGIN = int(SPAWN_MARGIN_BASE * (_RADAR_WIDTH / 1500))
+_EDGE_OFFSET = int(_SPAWN_MARGIN * 0.8)
+
+# Inclusive heading ranges per spawn edge, indexed N, S (first), E, W, S (second).
+_EDGE_HDG_LO = np.array([r[0] for r in (
+    SPAWN_HEADING_NORTH, SPAWN_HEADING_SOUTH_1, SPAWN_HEADING_EAST, SPAWN_HEADING_WEST, SPAWN_HEADING_SOUTH_2
+)])
+_EDGE_HDG_HI = np.array([r[1] for r in (
+    SPAWN_HEADING_NORTH, SPAWN_HEADING_SOUTH_1, SPAWN_HEADING_EAST, SPAWN_HEADING_WEST, SPAWN_HEADING_SOUTH_2
+)])
+
+_rng = np.random.default_rng()
+
+
 def spawn_random_plane(i: int) -> Aircraft:
     """
     Spawns aircraft either along the radar edge (normal) or occasionally
     directly on a runway, ready to request takeoff.
     """
-    layout = calculate_layout(WIDTH, HEIGHT)
-    radar_width = layout["RADAR_WIDTH"]
-    radar_height = layout["RADAR_HEIGHT"]
-    margin = int(SPAWN_MARGIN_BASE * (radar_width / 1500))
-    edge_offset = int(margin * 0.8)
-
-    spawn_on_runway = random.random() < RUNWAY_SPAWN_PROBABILITY
-
-    # ======================================================
-    # 🛫 1️⃣  Get real runway objects if we’re spawning on one
-    # ======================================================
-    if spawn_on_runway:
-        available_runways = all_runways()
-        if not available_runways:
-            spawn_on_runway = False
-        else:
-            rwy_obj = random.choice(available_runways)
-
-    # ======================================================
-    # 🛫 2️⃣  Runway-based spawn logic
-    # ======================================================
-    if spawn_on_runway:
-        # Use pre-built, scaled runway object
-        cx, cy = rwy_obj.x, rwy_obj.y
-        bearing_rad = math.radians(rwy_obj.bearing)
-        half_len_px = nm_to_px(rwy_obj.length_nm) / 2
-
-        # Spawn along runway centerline, near threshold
-        spawn_dist = half_len_px * 0.9
-        x = cx - math.sin(bearing_rad) * spawn_dist
-        y = cy + math.cos(bearing_rad) * spawn_dist
-
-        # Tiny lateral offset (± few px) for variety
-        lateral = random.uniform(-8, 8)
-        x += math.cos(bearing_rad) * lateral
-        y += math.sin(bearing_rad) * lateral
-
-        hdg = int(rwy_obj.bearing)
-        alt = RUNWAY_SPAWN_ALT_FT
-        spd = 0
-        on_runway = True
-        assigned_runway = rwy_obj.name
-
-        # Optional: flip direction 50% of time (use reciprocal threshold)
-        if random.random() < 0.5:
-            hdg = (hdg + 180) % 360
-            x = cx + math.sin(bearing_rad) * spawn_dist
-            y = cy - math.cos(bearing_rad) * spawn_dist
-
-    # ======================================================
-    # ✈️ 3️⃣  Normal (airborne) spawn fallback
-    # ======================================================
-    else:
-        edge = random.choice("NSEW")
-        if edge == "N":
-            x = random.randint(margin, radar_width - margin)
-            y = -edge_offset
-            hdg = random.randint(*SPAWN_HEADING_NORTH)
-        elif edge == "S":
-            x = random.randint(margin, radar_width - margin)
-            y = radar_height + edge_offset
-            hdg = random.randint(*SPAWN_HEADING_SOUTH_1) if random.random() < 0.5 else random.randint(*SPAWN_HEADING_SOUTH_2)
-        elif edge == "E":
-            x = radar_width + edge_offset
-            y = random.randint(margin, radar_height - margin)
-            hdg = random.randint(*SPAWN_HEADING_EAST)
+    return spawn_random_planes(1)[0]
+
+
+def spawn_random_planes(n: int) -> List[Aircraft]:
+    """Spawn `n` aircraft, drawing all of their randomness as batched arrays."""
+    runways = all_runways()
+
+    on_runway = (_rng.random(n) < RUNWAY_SPAWN_PROBABILITY).tolist() if runways else [False] * n
+    rwy_picks = _rng.integers(len(runways), size=n).tolist() if runways else [0] * n
+    laterals = _rng.uniform(-8, 8, n).tolist()
+    flips = (_rng.random(n) < 0.5).tolist()
+
+    edges = _rng.integers(4, size=n)
+    hdg_idx = np.where((edges == 1) & (_rng.random(n) >= 0.5), 4, edges)
+    edge_hdgs = _rng.integers(_EDGE_HDG_LO[hdg_idx], _EDGE_HDG_HI[hdg_idx] + 1).tolist()
+    edge_xs = _rng.integers(_SPAWN_MARGIN, _RADAR_WIDTH - _SPAWN_MARGIN + 1, n).tolist()
+    edge_ys = _rng.integers(_SPAWN_MARGIN, _RADAR_HEIGHT - _SPAWN_MARGIN + 1, n).tolist()
+    edges = edges.tolist()
+
+    alts = _rng.choice(SPAWN_ALTS, n).tolist()
+    spds = _rng.choice(SPAWN_SPEEDS, n).tolist()
+    codes = _rng.integers(len(_AIRLINE_CODES), size=n).tolist()
+    flight_numbers = _rng.integers(1, 1000, n).tolist()
+    types = _rng.integers(len(PLANE_TYPES), size=n).tolist()
+
+    planes = []
+    for k in range(n):
+        if on_runway[k]:
+            # Use pre-built, scaled runway object
+            rwy_obj = runways[rwy_picks[k]]
+            cx, cy = rwy_obj.x, rwy_obj.y
+            spawn_dist = rwy_obj.half_len_px * 0.9
+            sin_b, cos_b = rwy_obj.sin_b, rwy_obj.cos_b
+
+            # Spawn along runway centerline, near threshold, with a tiny lateral
+            # offset for variety; flip to the reciprocal threshold 50% of the time.
+            hdg = int(rwy_obj.bearing)
+            if flips[k]:
+                hdg = (hdg + 180) % 360
+                x = cx + sin_b * spawn_dist
+                y = cy - cos_b * spawn_dist
+            else:
+                x = cx - sin_b * spawn_dist + cos_b * laterals[k]
+                y = cy + cos_b * spawn_dist + sin_b * laterals[k]
+            alt = RUNWAY_SPAWN_ALT_FT
+            spd = 0
+            assigned_runway = rwy_obj.name
         else:
-            x = -edge_offset
-            y = random.randint(margin, radar_height - margin)
-            hdg = random.randint(*SPAWN_HEADING_WEST)
-        alt = random.choice(SPAWN_ALTS)
-        spd = random.choice(SPAWN_SPEEDS)
-        on_runway = False
-        assigned_runway = None
-
-    # ======================================================
-    # 🧠 4️⃣  Aircraft creation + state setup
-    # ======================================================
-    airline_name = random.choice(list(AIRLINES.keys()))
-    airline = AIRLINES[airline_name]
-    iata = airline["IATA"] or airline["ICAO"]
-    flight_number = random.randint(1, 999)
-    cs = f"{iata}{flight_number:03d}"
-
-    plane = Aircraft(
-        cs,
-        x, y,
-        normalize_hdg(hdg),
-        spd,
-        alt,
-        dest_alt=DEFAULT_DEST_ALT,
-        aircraft_type=random.choice(PLANE_TYPES)
-    )
+            edge = edges[k]
+            hdg = edge_hdgs[k]
+            if edge == 0:
+                x, y = edge_xs[k], -_EDGE_OFFSET
+            elif edge == 1:
+                x, y = edge_xs[k], _RADAR_HEIGHT + _EDGE_OFFSET
+            elif edge == 2:
+                x, y = _RADAR_WIDTH + _EDGE_OFFSET, edge_ys[k]
+            else:
+                x, y = -_EDGE_OFFSET, edge_ys[k]
+            alt = alts[k]
+            spd = spds[k]
+            assigned_runway = None
+
+        plane = Aircraft(
+            f"{_AIRLINE_CODES[codes[k]]}{flight_numbers[k]:03d}",
+            x, y,
+            normalize_hdg(hdg),
+            spd,
+            alt,
+            dest_alt=DEFAULT_DEST_ALT,
+            aircraft_type=PLANE_TYPES[types[k]]
+        )
 
-    plane.on_runway = on_runway
-    plane.assigned_runway = assigned_runway
+        plane.on_runway = on_runway[k]
+        plane.assigned_runway = assigned_runway
 
-    if plane.on_runway:
-        plane.state = "TAKEOFF_PENDING"
-        plane.dest_alt = RUNWAY_SPAWN_ALT_FT
-    else:
-        plane.state = "AIRBORNE"
+        if plane.on_runway:
+            plane.state = State.TAKEOFF_PENDING
+            plane.dest_alt = RUNWAY_SPAWN_ALT_FT
+        else:
+            plane.state = State.AIRBORNE
+
+        planes.append(plane)
 
-    return plane
\ No newline at end of file
+    return planes
@@ -1,23 +1,28 @@
 import dataclasses
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .runway_v2 import Runway
     from .aircraft_v2 import Aircraft
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Airport:
     icao: str
     name: str
     runways: List["Runway"]
     arrivals: List["Aircraft"] = dataclasses.field(default_factory=list)
+    _runways_by_name: Dict[str, "Runway"] = dataclasses.field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        for r in self.runways:
+            self._runways_by_name.setdefault(r.name, r)
 
     def register_arrival(self, aircraft: "Aircraft"):
         if aircraft not in self.arrivals:
             self.arrivals.append(aircraft)
     
     def get_runway(self, name: str) -> Optional["Runway"]:
-        return next((r for r in self.runways if r.name == name), None)
+        return self._runways_by_name.get(name)
     
     def active_runways(self):
         return [r for r in self.runways if r.active_aircraft]
@@ -1,6 +1,6 @@
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Command:
     type: str
     value: str | None = None
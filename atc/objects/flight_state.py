@@ -0,0 +1,16 @@
+from enum import IntEnum
+
+class State(IntEnum):
+    """Aircraft flight phase. Ordered so LANDING and LANDED are the highest values."""
+    AIRBORNE = 0
+    TAKEOFF_PENDING = 1
+    ON_RUNWAY = 2
+    TAKEOFF = 3
+    LANDING = 4
+    LANDED = 5
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __format__(self, spec: str) -> str:
+        return format(self.name, spec)
@@ -1,5 +1,5 @@
-import dataclasses, pygame, time
-from atc.utils import normalize_hdg, heading_to_vec, nm_to_px, calculate_layout, load_runways, scale_position
+import dataclasses, math, pygame, time
+from atc.utils import normalize_hdg, nm_to_px, calculate_layout, load_runways, scale_position, render_cached
 from constants import (
     HEIGHT, WIDTH,
     COLOUR_RUNWAY_BASE, COLOUR_RUNWAY_AVAILABLE, COLOUR_RUNWAY_OCCUPIED, COLOUR_RUNWAY_CLOSED,
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from .aircraft_v2 import Aircraft
 
 _RUNWAYS: list["Runway"] = []
+_RUNWAYS_BY_NAME: dict[str, "Runway"] = {}
 _AIRPORTS: list["Airport"] = []
 
 
@@ -62,17 +63,21 @@ def _build_runways():
 
 
 def all_runways() -> list["Runway"]:
-    global _RUNWAYS
+    global _RUNWAYS, _RUNWAYS_BY_NAME
     if not _RUNWAYS:
         _RUNWAYS = _build_runways()
+        _RUNWAYS_BY_NAME = {}
+        for r in _RUNWAYS:
+            _RUNWAYS_BY_NAME.setdefault(r.name, r)
     return _RUNWAYS
 
 
 def get_runway(name: str) -> Optional["Runway"]:
-    return next((r for r in all_runways() if r.name == name), None)
+    all_runways()
+    return _RUNWAYS_BY_NAME.get(name)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Runway:
     name: str
     x: int
@@ -86,8 +91,18 @@ class Runway:
     last_used: float = 0.0
     airport: Optional["Airport"] = None
 
+    # Derived from bearing/length once at build time; runways never move.
+    opposite_bearing: int = dataclasses.field(init=False, default=0)
+    sin_b: float = dataclasses.field(init=False, default=0.0)
+    cos_b: float = dataclasses.field(init=False, default=1.0)
+    half_len_px: float = dataclasses.field(init=False, default=0.0)
+
     def __post_init__(self):
         self.opposite_bearing = normalize_hdg(self.bearing + 180)
+        bearing_rad = math.radians(self.bearing)
+        self.sin_b = math.sin(bearing_rad)
+        self.cos_b = math.cos(bearing_rad)
+        self.half_len_px = nm_to_px(self.length_nm) / 2
 
     def is_available(self):
         return self.status == RUNWAY_DEFAULT_STATUS and self.active_aircraft is None
@@ -95,22 +110,23 @@ class Runway:
     def occupy(self, aircraft: "Aircraft"):
         self.active_aircraft = aircraft
         self.status = RUNWAY_OCCUPIED_STATUS
-        self.last_used = time.time()
+        self.last_used = time.monotonic()
 
     def release(self):
         self.active_aircraft = None
         self.status = RUNWAY_DEFAULT_STATUS
-        self.last_used = time.time()
+        self.last_used = time.monotonic()
 
-    def draw(self, screen, font):
-        layout = calculate_layout(*screen.get_size())
+    def draw(self, screen, font, layout=None):
+        if layout is None:
+            layout = calculate_layout(*screen.get_size())
         scale = layout["RING_SCALE"]
 
         cx, cy = scale_position(self.x, self.y, layout)
 
-        half_len_px = nm_to_px(self.length_nm / 2) * scale
+        half_len_px = self.half_len_px * scale
 
-        dx, dy = heading_to_vec(self.bearing)
+        dx, dy = self.sin_b, -self.cos_b
         start = (cx - dx * half_len_px, cy - dy * half_len_px)
         end   = (cx + dx * half_len_px, cy + dy * half_len_px)
 
@@ -131,12 +147,12 @@ class Runway:
         label_a = f"{int(round(self.bearing / 10)) % 36:02d}"
         label_b = f"{int(round(self.opposite_bearing / 10)) % 36:02d}"
 
-        text_a = font.render(label_a, True, colour)
-        text_b = font.render(label_b, True, colour)
+        text_a = render_cached(font, label_a, colour)
+        text_b = render_cached(font, label_b, colour)
         screen.blit(text_a, (start[0] + label_offset_x, start[1] + label_offset_y))
         screen.blit(text_b, (end[0]   - 20,            end[1]   + label_offset_x))
 
-        name_text = font.render(self.name, True, COLOUR_RUNWAY_LABEL)
+        name_text = render_cached(font, self.name, COLOUR_RUNWAY_LABEL)
         screen.blit(name_text, (cx + name_offset_x, cy + name_offset_y))
 
 
@@ -1,69 +1,131 @@
-import math, pygame
-from atc.utils import heading_to_vec, load_fixes, nm_to_px, wrap_text, calculate_layout, scale_position
+import functools, math, pygame
+import numpy as np
+from atc.utils import heading_to_vec, heading_vecs, load_fixes, nm_to_px, wrap_text, calculate_layout, scale_position, scale_positions, render_cached, get_font
 from constants import *
+from atc.objects.flight_state import State
 
-def draw_flight_progress_log(screen, font, planes_or_snapshot, layout=None):
-    if not layout:
-        layout = calculate_layout(WIDTH, HEIGHT)
+# pygame-ce's fblits skips building the rect list; classic pygame only has blits.
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+def _blit_all(surface, seq):
+    """Blit a sequence of (source, dest) pairs in a single call."""
+    if _HAS_FBLITS:
+        surface.fblits(seq)
+    else:
+        surface.blits(seq, doreturn=False)
+
+_FPL_STATE_COLOURS = {
+    "AIRBORNE": COLOUR_STATE_AIRBORNE,
+    "CLIMBING": COLOUR_STATE_AIRBORNE,
+    "CRUISE": COLOUR_STATE_AIRBORNE,
+    "LANDING": COLOUR_STATE_APPROACH,
+    "APPROACH": COLOUR_STATE_APPROACH,
+    "TAKEOFF": COLOUR_STATE_TAKEOFF,
+    "LANDED": COLOUR_STATE_LANDED,
+}
+
+# Indexed by State value; states the FPL has no colour for fall back to unknown.
+_FPL_STATE_LUT = [_FPL_STATE_COLOURS.get(state.name, COLOUR_STATE_UNKNOWN) for state in State]
+
+# One record per plane, published to the detached FPL window in place of a list of dicts.
+FPL_DTYPE = np.dtype([("callsign", "U8"), ("alt", "i4"), ("spd", "i4"), ("hdg", "i2"), ("state", "u1")])
+
+def flight_progress_records(planes):
+    """Pack the FPL columns of `planes` into a FPL_DTYPE array; alt/spd/hdg truncate like int()."""
+    n = len(planes)
+    records = np.empty(n, dtype=FPL_DTYPE)
+    records["callsign"] = [p.callsign for p in planes]
+    records["alt"] = np.fromiter((p.alt for p in planes), dtype=float, count=n)
+    records["spd"] = np.fromiter((p.spd for p in planes), dtype=float, count=n)
+    records["hdg"] = np.fromiter((p.hdg for p in planes), dtype=float, count=n)
+    records["state"] = np.fromiter((p.state for p in planes), dtype=np.uint8, count=n)
+    return records
+
+_FPL_LEGEND = (
+    ("Airborne", COLOUR_STATE_AIRBORNE),
+    ("Approach", COLOUR_STATE_APPROACH),
+    ("Takeoff", COLOUR_STATE_TAKEOFF),
+    ("Landed", COLOUR_STATE_LANDED),
+)
+
+@functools.lru_cache(maxsize=8)
+def _fpl_row_tile(width, colour):
+    """Solid FPL row background, blitted per row instead of filling a rect."""
+    tile = pygame.Surface((width, FPL_ROW_HEIGHT))
+    tile.fill(colour)
+    return tile
+
+@functools.lru_cache(maxsize=256)
+def _fpl_row_text(font, callsign, alt, spd, hdg):
+    """Rendered FPL row text, keyed on the displayed values so the string is only formatted on a miss."""
+    return font.render(f"{callsign:8}  {alt:5}ft  {spd:3}kt  {hdg:03d}°", True, COLOUR_FPL_TEXT)
+
+@functools.lru_cache(maxsize=4)
+def _fpl_chrome(font, panel_w, panel_h):
+    """FPL panel background, border and title, which never change between frames."""
+    chrome = pygame.Surface((panel_w, panel_h))
+    chrome.fill(COLOUR_FPL_BG)
+    pygame.draw.rect(chrome, COLOUR_FPL_BORDER, (0, 0, panel_w, panel_h), 1)
+    chrome.blit(render_cached(font, "FLIGHT PROGRESS LOG", COLOUR_FPL_TITLE), (10, 10))
+    return chrome
+
+@functools.lru_cache(maxsize=4)
+def _fpl_legend(font):
+    """Transparent Surface with the state legend; labels sit 2 px above their swatches, so it is blitted 2 px high."""
+    labels = [render_cached(font, label, COLOUR_LEGEND_TEXT) for label, _ in _FPL_LEGEND]
+    width = 30 + max(label.get_width() for label in labels)
+    height = max(k * 18 + max(17, label.get_height()) for k, label in enumerate(labels))
+    legend = pygame.Surface((width, height), pygame.SRCALPHA)
+    for k, ((_, color), label) in enumerate(zip(_FPL_LEGEND, labels)):
+        pygame.draw.rect(legend, color, (10, k * 18 + 2, 15, 15))
+        legend.blit(label, (30, k * 18))
+    return legend
 
+def draw_flight_progress_log(screen, font, planes_or_snapshot, layout=None):
+    """Draw the FPL panel for a flight_progress_records() array centred on `screen` and return the Rect it covers."""
     panel_w, panel_h = 400, 440
     surf_w, surf_h = screen.get_size()
     panel_x = (surf_w - panel_w) // 2
     panel_y = (surf_h - panel_h) // 2
 
-    pygame.draw.rect(screen, COLOUR_FPL_BG, (panel_x, panel_y, panel_w, panel_h))
-    pygame.draw.rect(screen, COLOUR_FPL_BORDER, (panel_x, panel_y, panel_w, panel_h), 1)
-
-    title = font.render("FLIGHT PROGRESS LOG", True, COLOUR_FPL_TITLE)
-    screen.blit(title, (panel_x + 10, panel_y + 10))
+    text_seq = [(_fpl_chrome(font, panel_w, panel_h), (panel_x, panel_y))]
 
     y = panel_y + 35
-    for ac in planes_or_snapshot:
-        state = ac.get("state", "UNKNOWN").upper()
-        bg = {
-            "AIRBORNE": COLOUR_STATE_AIRBORNE,
-            "CLIMBING": COLOUR_STATE_AIRBORNE,
-            "CRUISE": COLOUR_STATE_AIRBORNE,
-            "LANDING": COLOUR_STATE_APPROACH,
-            "APPROACH": COLOUR_STATE_APPROACH,
-            "TAKEOFF": COLOUR_STATE_TAKEOFF,
-            "LANDED": COLOUR_STATE_LANDED,
-        }.get(state, COLOUR_STATE_UNKNOWN)
-
-        pygame.draw.rect(screen, bg, (panel_x + 5, y, panel_w - 10, FPL_ROW_HEIGHT))
-        info = f"{ac['callsign']:8}  {int(ac['alt']):5}ft  {int(ac['spd']):3}kt  {int(ac['hdg']):03d}°"
-        txt = font.render(info, True, COLOUR_FPL_TEXT)
-        screen.blit(txt, (panel_x + 10, y + 3))
+    for callsign, alt, spd, hdg, state in planes_or_snapshot.tolist():
+        # Tile and text interleave in one batch so each row still covers any overhang from the one above.
+        text_seq.append((_fpl_row_tile(panel_w - 10, _FPL_STATE_LUT[state]), (panel_x + 5, y)))
+        text_seq.append((_fpl_row_text(font, callsign, alt, spd, hdg), (panel_x + 10, y + 3)))
         y += FPL_ROW_HEIGHT + 2
         if y > panel_y + panel_h - FPL_ROW_HEIGHT:
             break
+    _blit_all(screen, text_seq)
 
-    legend_y = panel_y + panel_h - FPL_LEGEND_HEIGHT
-    legend = [
-        ("Airborne", COLOUR_STATE_AIRBORNE),
-        ("Approach", COLOUR_STATE_APPROACH),
-        ("Takeoff", COLOUR_STATE_TAKEOFF),
-        ("Landed", COLOUR_STATE_LANDED),
-    ]
-    for label, color in legend:
-        pygame.draw.rect(screen, color, (panel_x + 10, legend_y, 15, 15))
-        screen.blit(font.render(label, True, COLOUR_LEGEND_TEXT), (panel_x + 30, legend_y - 2))
-        legend_y += 18
+    # Rows can run into the legend area, so the legend goes on top.
+    screen.blit(_fpl_legend(font), (panel_x, panel_y + panel_h - FPL_LEGEND_HEIGHT - 2))
+    return pygame.Rect(panel_x, panel_y, panel_w, panel_h)
 
-    return
 
+@functools.lru_cache(maxsize=16)
+def _aircraft_icon(size, colour):
+    """Unrotated square aircraft icon; one per (size, colour) instead of one per plane per frame."""
+    icon = pygame.Surface((size, size), pygame.SRCALPHA)
+    icon.fill(colour)
+    return icon
 
-def draw_aircraft(screen, font, plane, active=False, layout=None):
-    """
-    Draw aircraft icon, heading line, and labels — all scaled to current layout.
-    Keeps aircraft visible and proportionally positioned when the window size changes.
-    """
-    from atc.utils import scale_position
+_ICON_ROTATION_STEP_DEG = 5
+_ICON_ROTATIONS = 360 // _ICON_ROTATION_STEP_DEG
 
-    if layout is None:
-        layout = calculate_layout(*screen.get_size())
+@functools.lru_cache(maxsize=4 * _ICON_ROTATIONS)
+def _rotated_icon(size, colour, bucket):
+    """Aircraft icon rotated to heading bucket * _ICON_ROTATION_STEP_DEG."""
+    return pygame.transform.rotate(_aircraft_icon(size, colour), -bucket * _ICON_ROTATION_STEP_DEG)
+
+def _aircraft_sprites(font, plane, active, layout, pos=None, end=None):
+    """Return (icon blit, heading line, label blit) for one aircraft, ready to draw.
 
-    x, y = scale_position(plane.x, plane.y, layout)
+    `pos` and `end` are the plane's scaled screen position and heading-line end point, when the caller has them.
+    """
+    x, y = pos if pos is not None else scale_position(plane.x, plane.y, layout)
     scale = layout["RING_SCALE"]
 
     if plane.ai_controlled:
@@ -76,33 +138,78 @@ def draw_aircraft(screen, font, plane, active=False, layout=None):
     icon_size = max(2, int(PLANE_ICON_SIZE * scale))
     heading_line_len = int(PLANE_HEADING_LINE_LENGTH * scale)
 
-    rect = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-    rect.fill(colour)
-    rotated = pygame.transform.rotate(rect, -plane.hdg)
-    rect_rect = rotated.get_rect(center=(x, y))
-    screen.blit(rotated, rect_rect.topleft)
-
-    dx, dy = heading_to_vec(plane.hdg)
-    end_x = x + dx * heading_line_len
-    end_y = y + dy * heading_line_len
-    pygame.draw.line(screen, colour, (x, y), (end_x, end_y), 2)
+    rotated = _rotated_icon(icon_size, colour, int(plane.hdg / _ICON_ROTATION_STEP_DEG + 0.5) % _ICON_ROTATIONS)
+    icon = (rotated, rotated.get_rect(center=(x, y)).topleft)
 
-    topline_const = f"{plane.callsign} {plane.state}"
-    bottomline_const = f"{int(plane.alt)} {int(plane.spd)} {int(plane.hdg)}"
-
-    text_topline = font.render(topline_const, True, colour)
-    text_bottomline = font.render(bottomline_const, True, colour)
+    if end is None:
+        dx, dy = heading_to_vec(plane.hdg)
+        end = (x + dx * heading_line_len, y + dy * heading_line_len)
+    line = (colour, (x, y), end)
 
     tag_offset_x = int(PLANE_TAG_OFFSET_X * scale)
     tag_offset_y_call = int(PLANE_TAG_OFFSET_Y_CALLSIGN * scale)
     tag_offset_y_info = int(PLANE_TAG_OFFSET_Y_INFO * scale)
 
-    screen.blit(text_topline, (x + tag_offset_x, y + tag_offset_y_call))
-    screen.blit(text_bottomline, (x + tag_offset_x, y + tag_offset_y_info))
+    text = _plane_label(
+        font, plane.callsign, plane.state, int(plane.alt), int(plane.spd), int(plane.hdg),
+        colour, tag_offset_y_info - tag_offset_y_call,
+    )
+    label = (text, (x + tag_offset_x, y + tag_offset_y_call))
+    return icon, line, label
+
+@functools.lru_cache(maxsize=256)
+def _plane_label(font, callsign, state, alt, spd, hdg, colour, line_gap):
+    """Both data-block lines on one Surface, the bottom line `line_gap` px below the top.
+
+    Keyed on the displayed values, so level, on-speed planes reuse the same Surface every
+    frame without formatting their text.
+    """
+    top = font.render(f"{callsign} {state}", True, colour)
+    bottom = font.render(f"{alt} {spd} {hdg}", True, colour)
+    label = pygame.Surface(
+        (max(top.get_width(), bottom.get_width()), max(top.get_height(), line_gap + bottom.get_height())),
+        pygame.SRCALPHA,
+    )
+    label.blit(top, (0, 0))
+    label.blit(bottom, (0, line_gap))
+    return label
+
+def _on_radar_mask(sx, sy, font, layout):
+    """True for planes whose icon, heading line or data block can reach the radar rect.
+
+    The data block hangs off to the right, so planes left of the scope keep a wider
+    margin (16 glyph heights comfortably covers the longest callsign and state).
+    """
+    radar_rect = layout["RADAR_RECT"]
+    scale = layout["RING_SCALE"]
+    reach = 2 + max(
+        int(PLANE_HEADING_LINE_LENGTH * scale),
+        max(2, int(PLANE_ICON_SIZE * scale)),
+        -int(PLANE_TAG_OFFSET_Y_CALLSIGN * scale),
+    )
+    label_reach = int(PLANE_TAG_OFFSET_X * scale) + 16 * font.get_height()
+    return (
+        (sx >= radar_rect.left - label_reach) & (sx < radar_rect.right + reach)
+        & (sy >= radar_rect.top - reach - 2 * font.get_height()) & (sy < radar_rect.bottom + reach)
+    )
+
+def draw_aircraft(screen, font, plane, active=False, layout=None):
+    """
+    Draw aircraft icon, heading line, and labels — all scaled to current layout.
+    Keeps aircraft visible and proportionally positioned when the window size changes.
+    """
+    if layout is None:
+        layout = calculate_layout(*screen.get_size())
+
+    icon, (colour, start, end), label = _aircraft_sprites(font, plane, active, layout)
+    screen.blit(*icon)
+    pygame.draw.line(screen, colour, start, end, 2)
+    screen.blit(*label)
 
 def draw_performance_menu(screen, font, planes_or_snapshot, *args, **kwargs):
     """
-    Draws performance statistics (in main view or detached window).
+    Draws performance statistics (in main view or detached window) and
+    returns the Rect it covers.
 
     planes_or_snapshot:
         • In the main process → list of plane objects
@@ -135,105 +242,60 @@ def draw_performance_menu(screen, font, planes_or_snapshot, *args, **kwargs):
     surf.fill(COLOUR_PERF_BG)
 
 
-    y = 10
-    for line in lines:
-        surf.blit(font.render(line, True, COLOUR_PERF_TEXT), (10, y))
-        y += 22
-
-    screen.blit(surf, (10, 10))
-    return
-
-def draw_conflict_indicator(a, b, lat, vert, screen, font, radar_rect, cy):
-    msg = f"CONFLICT {a.callsign}-{b.callsign} {lat:.1f}NM {vert:.0f}FT"
-    screen.blit(font.render(msg, True, COLOUR_CONFLICT), (radar_rect.left + 5, cy))
-
-def draw_radar(screen, planes, font, conflicts,
-               radio_log=None, active_cs=None, selected_plane=None, radio_scroll=0,
-               runways=None):
-
-    window_w, window_h = screen.get_size()
-    layout = calculate_layout(window_w, window_h)
-
-    radar_rect = layout["RADAR_RECT"]
-    sidebar_rect = layout["SIDEBAR_RECT"]
-    radar_center = layout["RADAR_CENTER"]
-
-    screen.fill(COLOUR_RADAR_BG, radar_rect)
-
-    if runways:
-        for rw in runways:
-            rw.draw(screen, font)
-
-    fixes = load_fixes(layout)
-    for name, position in fixes.items():
-        x, y = position["x"], position["y"]
-        scale = position.get("ring_scale", 1.0)
-
-        for nm in range(*RADAR_FIX_RING_SPACING_NM):
-            pixel = int(nm_to_px(nm) * layout["RING_SCALE"])
-            pygame.draw.circle(screen, COLOUR_FIX_RING, (x, y), pixel, 1)
-            label = font.render(f"{nm}", True, COLOUR_FIX_TEXT)
-            label_offset = int(8 * layout["RING_SCALE"])
-            screen.blit(label, (x + pixel + 4, y - label_offset))
-
-        for deg in range(0, 360, RADAR_HEADING_INTERVAL_DEG):
-            rad = math.radians(deg)
-            length = nm_to_px(RADAR_LINE_RANGE_NM) * layout["RING_SCALE"]
-            dx = math.sin(rad) * length
-            dy = -math.cos(rad) * length
-            pygame.draw.line(screen, (60, 60, 120), (x, y), (x + dx, y + dy))
-
-        pygame.draw.circle(screen, COLOUR_FIX_CENTER_OUTER, (x, y), int(5 * scale))
-        pygame.draw.circle(screen, COLOUR_FIX_CENTER_INNER, (x, y), int(2 * scale))
-        name_txt = font.render(name, True, COLOUR_FIX_LABEL)
-        screen.blit(name_txt, (x + int(10 * scale), y - int(10 * scale)))
-
-    scale = layout["RING_SCALE"]
-    for radius in range(RADAR_RING_SPACING, RADAR_RING_MAX_RADIUS, RADAR_RING_SPACING):
-        pygame.draw.circle(screen, COLOUR_RADAR_GRID, RADAR_CENTER, int(radius * scale), 1)
+    # Only the header is static; the counters change nearly every frame and would just churn the shared cache.
+    _blit_all(surf, [
+        (render_cached(font, line, COLOUR_PERF_TEXT) if i == 0 else font.render(line, True, COLOUR_PERF_TEXT), (10, 10 + i * 22))
+        for i, line in enumerate(lines)
+    ])
 
-    pygame.draw.line(screen, COLOUR_RADAR_GRID,
-                     (radar_center[0], radar_rect.top), (radar_center[0], radar_rect.bottom), 1)
-    pygame.draw.line(screen, COLOUR_RADAR_GRID,
-                     (radar_rect.left, radar_center[1]), (radar_rect.right, radar_center[1]), 1)
+    return screen.blit(surf, (10, 10))
 
-    for plane in planes:
-        draw_aircraft(screen, font, plane, active=(plane.callsign == active_cs))
+def _conflict_label(a, b, lat, vert, font):
+    return font.render(f"CONFLICT {a.callsign}-{b.callsign} {lat:.1f}NM {vert:.0f}FT", True, COLOUR_CONFLICT)
 
-    cy = radar_rect.top + 5
-    for a, b, lat, vert in conflicts:
-        draw_conflict_indicator(a, b, lat, vert, screen, font, radar_rect, cy)
-        cy += 18
+def draw_conflict_indicator(a, b, lat, vert, screen, font, radar_rect, cy):
+    screen.blit(_conflict_label(a, b, lat, vert, font), (radar_rect.left + 5, cy))
 
-    pygame.draw.rect(screen, COLOUR_SIDEBAR_BG, sidebar_rect)
-    pygame.draw.line(screen, COLOUR_SIDEBAR_BORDER,
-                     (sidebar_rect.left, sidebar_rect.top),
-                     (sidebar_rect.left, sidebar_rect.bottom), 1)
+@functools.lru_cache(maxsize=512)
+def _render_wrapped(msg, colour, font, max_width):
+    """Wrapped and rendered lines of one radio-log message; log entries never change once appended."""
+    return tuple(font.render(line, True, colour) for line in wrap_text(msg, font, max_width))
 
-    display_plane = selected_plane or next((p for p in planes if p.callsign == active_cs), None)
+@functools.lru_cache(maxsize=8)
+def _fitted_hint(msg, font, max_width):
+    """Shrink `font` until `msg` fits `max_width`; returns (font, rendered wrapped lines)."""
+    msg_font = font
+    while msg_font.size(msg)[0] > max_width and msg_font.get_height() > 10:
+        msg_font = get_font(int(msg_font.get_height() * 0.9))
+    return msg_font, tuple(msg_font.render(line, True, COLOUR_MSG_HINT) for line in wrap_text(msg, msg_font, max_width))
 
-    hover_timestamp = None
-    hover_pos = (0, 0)
-    mx, my = pygame.mouse.get_pos()
+_sidebar_key = None
+_sidebar_cache = None
 
-    if display_plane:
-        cs = display_plane.callsign
-        x0 = sidebar_rect.x + 10
-        y0 = sidebar_rect.y + 10
+def _build_sidebar(screen, font, sidebar_rect, cs, log, radio_scroll):
+    """Render the sidebar (radio log of `cs`, or the selection hint) onto its own Surface.
 
-        screen.blit(font.render(f"ACTIVE: {cs}", True, COLOUR_MSG_TITLE), (x0, y0))
+    Returns (surface, rows) where rows are the screen Rects and timestamps of log lines that
+    carry one, for the hover tooltip.
+    """
+    sidebar = pygame.Surface(sidebar_rect.size, 0, screen)
+    sidebar.fill(COLOUR_SIDEBAR_BG)
+    width, height = sidebar_rect.size
+    rows = []
+
+    if cs:
+        x0, y0 = 10, 10
+        seq = [(render_cached(font, f"ACTIVE: {cs}", COLOUR_MSG_TITLE), (x0, y0))]
         y = y0 + 28
 
-        log = radio_log.get(cs, []) if radio_log else []
         if not log:
-            screen.blit(font.render("(no messages yet)", True, COLOUR_MSG_PLACEHOLDER), (x0, y))
+            seq.append((render_cached(font, "(no messages yet)", COLOUR_MSG_PLACEHOLDER), (x0, y)))
         else:
-            max_lines = max(5, (sidebar_rect.height - 60) // 18)
+            max_lines = max(5, (height - 60) // 18)
             start = max(0, len(log) - max_lines - radio_scroll)
             end = max(0, len(log) - radio_scroll)
-            subset = log[start:end]
 
-            for line in subset:
+            for line in log[start:end]:
                 if isinstance(line, dict):
                     msg = line.get("text", "")
                     ts = line.get("timestamp")
@@ -243,44 +305,186 @@ def draw_radar(screen, planes, font, conflicts,
 
                 color = COLOUR_MSG_CTRL if msg.startswith("CTRL") else COLOUR_MSG_TEXT
 
-                for wrapped in wrap_text(msg, font, sidebar_rect.width - 20):
-                    if y > sidebar_rect.bottom - 20:
+                for text_surface in _render_wrapped(msg, color, font, width - 20):
+                    if y > height - 20:
                         break
-
-                    text_surface = font.render(wrapped, True, color)
-                    text_rect = text_surface.get_rect(x=x0, y=y)
-                    screen.blit(text_surface, text_rect)
-
-                    if text_rect.collidepoint(mx, my) and ts:
-                        hover_timestamp = ts
-                        hover_pos = (mx, my)
-
+                    seq.append((text_surface, (x0, y)))
+                    if ts:
+                        rows.append((text_surface.get_rect(x=sidebar_rect.x + x0, y=sidebar_rect.y + y), ts))
                     y += 18
 
             if len(log) > max_lines:
                 total = len(log) - max_lines
-                bar_area_h = sidebar_rect.height - 80
+                bar_area_h = height - 80
                 bar_h = max(20, int(bar_area_h * (max_lines / len(log))))
                 bar_y = int(sidebar_rect.y + 40 + (radio_scroll / max(total, 1)) * (bar_area_h - bar_h))
-                pygame.draw.rect(screen, COLOUR_MSG_SCROLLBAR,
-                                 (sidebar_rect.right - 10, bar_y, 6, bar_h))
+                pygame.draw.rect(sidebar, COLOUR_MSG_SCROLLBAR, (width - 10, bar_y - sidebar_rect.y, 6, bar_h))
+        _blit_all(sidebar, seq)
     else:
-        msg = "Click a plane to view log"
-        max_width = sidebar_rect.width - 20
-        msg_font = font
-        while msg_font.size(msg)[0] > max_width and msg_font.get_height() > 10:
-            new_size = int(msg_font.get_height() * 0.9)
-            msg_font = pygame.font.SysFont(DEFAULT_FONT, new_size)
-
-        lines = wrap_text(msg, msg_font, max_width)
-        y = sidebar_rect.y + 10
-        for line in lines:
-            txt = msg_font.render(line, True, COLOUR_MSG_HINT)
-            screen.blit(txt, (sidebar_rect.x + 10, y))
+        msg_font, lines = _fitted_hint("Click a plane to view log", font, width - 20)
+        y = 10
+        for txt in lines:
+            sidebar.blit(txt, (10, y))
             y += msg_font.get_height() + 2
+    return sidebar, rows
+
+def _sidebar(screen, font, sidebar_rect, cs, log, radio_scroll):
+    """Sidebar Surface and hover rows, rebuilt only when the shown log, scroll or layout changes.
+
+    Radio logs are append-only, so their length stands in for their contents.
+    """
+    global _sidebar_key, _sidebar_cache
+    key = (font, tuple(sidebar_rect), cs, id(log), len(log), radio_scroll)
+    if key != _sidebar_key:
+        _sidebar_cache = _build_sidebar(screen, font, sidebar_rect, cs, log, radio_scroll)
+        _sidebar_key = key
+    return _sidebar_cache
+
+_radar_bg_key = None
+_radar_bg = None
+
+_radial_rads = np.radians(np.arange(0, 360, RADAR_HEADING_INTERVAL_DEG))
+_RADIAL_UNIT_VECS = np.stack([np.sin(_radial_rads), -np.cos(_radial_rads)], axis=1)
+del _radial_rads
+
+@functools.lru_cache(maxsize=4)
+def _fix_stamp(ring_scale, font):
+    """Range rings, ring labels and radials shared by every fix, centred on a transparent Surface.
+
+    Returns (surface, half) where half is the offset from the surface's top-left to the fix.
+    """
+    rings = [(nm, int(nm_to_px(nm) * ring_scale)) for nm in range(*RADAR_FIX_RING_SPACING_NM)]
+    labels = [render_cached(font, f"{nm}", COLOUR_FIX_TEXT) for nm, _ in rings]
+    length = nm_to_px(RADAR_LINE_RANGE_NM) * ring_scale
+    label_offset = int(8 * ring_scale)
+    half = 2 + max(
+        [math.ceil(length)]
+        + [pixel + 4 + label.get_width() for (_, pixel), label in zip(rings, labels)]
+        + [label_offset + label.get_height() for label in labels]
+    )
+
+    stamp = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+    for (_, pixel), label in zip(rings, labels):
+        pygame.draw.circle(stamp, COLOUR_FIX_RING, (half, half), pixel, 1)
+        stamp.blit(label, (half + pixel + 4, half - label_offset))
+
+    for dx, dy in (_RADIAL_UNIT_VECS * length + half).tolist():
+        pygame.draw.line(stamp, (60, 60, 120), (half, half), (dx, dy))
+    return stamp, half
+
+def _build_radar_background(screen, font, layout):
+    """Draw the static scenery (fixes with their rings/radials/labels, range grid, crosshair) once."""
+    radar_rect = layout["RADAR_RECT"]
+    radar_center = layout["RADAR_CENTER"]
+    # Same pixel format as the screen so the per-frame blit is a straight copy.
+    bg = pygame.Surface(radar_rect.size, 0, screen)
+    bg.fill(COLOUR_RADAR_BG)
+    origin = (-radar_rect.left, -radar_rect.top)
+
+    stamp, half = _fix_stamp(layout["RING_SCALE"], font)
+    fixes = load_fixes(layout)
+    for name, position in fixes.items():
+        x, y = position["x"] + origin[0], position["y"] + origin[1]
+        scale = position.get("ring_scale", 1.0)
+
+        bg.blit(stamp, (x - half, y - half))
+        pygame.draw.circle(bg, COLOUR_FIX_CENTER_OUTER, (x, y), int(5 * scale))
+        pygame.draw.circle(bg, COLOUR_FIX_CENTER_INNER, (x, y), int(2 * scale))
+        name_txt = render_cached(font, name, COLOUR_FIX_LABEL)
+        bg.blit(name_txt, (x + int(10 * scale), y - int(10 * scale)))
+
+    scale = layout["RING_SCALE"]
+    grid_center = (RADAR_CENTER[0] + origin[0], RADAR_CENTER[1] + origin[1])
+    for radius in range(RADAR_RING_SPACING, RADAR_RING_MAX_RADIUS, RADAR_RING_SPACING):
+        pygame.draw.circle(bg, COLOUR_RADAR_GRID, grid_center, int(radius * scale), 1)
+
+    cx, cy = radar_center[0] + origin[0], radar_center[1] + origin[1]
+    pygame.draw.line(bg, COLOUR_RADAR_GRID, (cx, 0), (cx, radar_rect.height), 1)
+    pygame.draw.line(bg, COLOUR_RADAR_GRID, (0, cy), (radar_rect.width, cy), 1)
+    return bg
+
+def _radar_background(screen, font, layout):
+    """Static radar scenery for the current window size and font, rebuilt only when either changes."""
+    global _radar_bg_key, _radar_bg
+    key = (screen.get_size(), font)
+    if key != _radar_bg_key:
+        _radar_bg = _build_radar_background(screen, font, layout)
+        _radar_bg_key = key
+    return _radar_bg
+
+def draw_radar(screen, planes, font, conflicts,
+               radio_log=None, active_cs=None, selected_plane=None, radio_scroll=0,
+               runways=None, layout=None):
+
+    window_w, window_h = screen.get_size()
+    if layout is None:
+        layout = calculate_layout(window_w, window_h)
+
+    radar_rect = layout["RADAR_RECT"]
+    sidebar_rect = layout["SIDEBAR_RECT"]
+    radar_center = layout["RADAR_CENTER"]
+
+    screen.blit(_radar_background(screen, font, layout), radar_rect.topleft)
+
+    if runways:
+        for rw in runways:
+            rw.draw(screen, font, layout)
+
+    # Three batches (icons, heading lines, labels) instead of interleaving per plane;
+    # only the stacking between overlapping aircraft differs.
+    n = len(planes)
+    sx, sy = scale_positions(
+        np.fromiter((p.x for p in planes), dtype=float, count=n),
+        np.fromiter((p.y for p in planes), dtype=float, count=n),
+        layout,
+    )
+    heading_line_len = int(PLANE_HEADING_LINE_LENGTH * layout["RING_SCALE"])
+    vecs = heading_vecs(np.fromiter((p.hdg for p in planes), dtype=float, count=n)) * heading_line_len
+    ends = zip((sx + vecs[:, 0]).tolist(), (sy + vecs[:, 1]).tolist())
+    visible = _on_radar_mask(sx, sy, font, layout).tolist()
+    icon_seq, lines, label_seq = [], [], []
+    active_plane = None
+    for plane, pos, end, shown in zip(planes, zip(sx.tolist(), sy.tolist()), ends, visible):
+        active = plane.callsign == active_cs
+        if active and active_plane is None:
+            active_plane = plane
+        if not shown:
+            continue
+        icon, line, label = _aircraft_sprites(font, plane, active, layout, pos, end)
+        icon_seq.append(icon)
+        lines.append(line)
+        label_seq.append(label)
+    _blit_all(screen, icon_seq)
+    for colour, start, end in lines:
+        pygame.draw.line(screen, colour, start, end, 2)
+    _blit_all(screen, label_seq)
+
+    if conflicts:
+        x0, y0 = radar_rect.left + 5, radar_rect.top + 5
+        _blit_all(screen, [
+            (_conflict_label(a, b, lat, vert, font), (x0, y0 + k * 18))
+            for k, (a, b, lat, vert) in enumerate(conflicts)
+        ])
+
+    display_plane = selected_plane or active_plane
+    cs = display_plane.callsign if display_plane else None
+    log = radio_log.get(cs, ()) if cs and radio_log else ()
+    sidebar, rows = _sidebar(screen, font, sidebar_rect, cs, log, radio_scroll)
+    screen.blit(sidebar, sidebar_rect.topleft)
+    pygame.draw.line(screen, COLOUR_SIDEBAR_BORDER,
+                     (sidebar_rect.left, sidebar_rect.top),
+                     (sidebar_rect.left, sidebar_rect.bottom), 1)
+
+    hover_timestamp = None
+    hover_pos = (0, 0)
+    mx, my = pygame.mouse.get_pos()
+    for text_rect, ts in rows:
+        if text_rect.collidepoint(mx, my):
+            hover_timestamp = ts
+            hover_pos = (mx, my)
 
     if hover_timestamp:
-        tooltip_font = pygame.font.SysFont(DEFAULT_FONT, max(12, int(layout["FONT_SIZE_SIDEBAR"] * 0.9)))
+        tooltip_font = get_font(max(12, int(layout["FONT_SIZE_SIDEBAR"] * 0.9)))
         tooltip_text = tooltip_font.render(hover_timestamp, True, (255, 255, 255))
         pad = 6
         bg_rect = pygame.Rect(
@@ -300,14 +504,19 @@ def draw_radar(screen, planes, font, conflicts,
         screen.blit(tooltip_text, (bg_rect.x + pad, bg_rect.y + pad))
 
 def hit_test_aircraft(mouse_pos, planes, layout):
-    """Detect which aircraft (if any) the mouse clicked on."""
+    """Detect which aircraft (if any) the mouse clicked on; the first in list order wins."""
+    n = len(planes)
+    if not n:
+        return None
     mx, my = mouse_pos
-    for plane in planes:
-        px, py = scale_position(plane.x, plane.y, layout)
-        hit_radius = max(6, int(10 * layout["RING_SCALE"]))  # same as left-click
-        if (px - mx) ** 2 + (py - my) ** 2 <= hit_radius ** 2:
-            return plane
-    return None
+    px, py = scale_positions(
+        np.fromiter((p.x for p in planes), dtype=float, count=n),
+        np.fromiter((p.y for p in planes), dtype=float, count=n),
+        layout,
+    )
+    hit_radius = max(6, int(10 * layout["RING_SCALE"]))
+    hits = np.flatnonzero((px - mx) ** 2 + (py - my) ** 2 <= hit_radius ** 2)
+    return planes[hits[0]] if hits.size else None
 
 def draw_context_menu(screen, font, x, y):
     """Simple right-click context menu."""
@@ -317,10 +526,33 @@ def draw_context_menu(screen, font, x, y):
     pygame.draw.rect(screen, (30, 30, 40), rect, border_radius=6)
     pygame.draw.rect(screen, (120, 120, 150), rect, 1, border_radius=6)
     for i, text in enumerate(options):
-        txt = font.render(text, True, (255, 255, 255))
-        screen.blit(txt, (x + 10, y + 5 + i * 25))
+        screen.blit(render_cached(font, text, (255, 255, 255)), (x + 10, y + 5 + i * 25))
     return rect, options
 
+_alt_polyline_key = None
+_alt_polyline = []
+
+def _altitude_polyline(pts, width, height):
+    """Screen points for the (time, alt) history, recomputed only when the history or window size changes.
+
+    History gains a point about once a second, so most frames reuse the last polyline.
+    """
+    global _alt_polyline_key, _alt_polyline
+    if len(pts) < 2:
+        return []
+    key = (len(pts), pts[0], pts[-1], width, height)
+    if key != _alt_polyline_key:
+        arr = np.asarray(pts, dtype=float)
+        t, a = arr[:, 0], arr[:, 1]
+        min_alt = a.min()
+        scale_x = width / max(1.0, t[-1] - t[0])
+        scale_y = (height - 120) / max(1.0, a.max() - min_alt)
+        gx = ((t - t[0]) * scale_x).astype(int)
+        gy = (height - 60 - (a - min_alt) * scale_y).astype(int)
+        _alt_polyline = list(zip(gx.tolist(), gy.tolist()))
+        _alt_polyline_key = key
+    return _alt_polyline
+
 def draw_aircraft_profile_window(screen, font, planes_or_snapshot, *_):
     """Detached window showing live performance data."""
     snap = planes_or_snapshot
@@ -329,19 +561,9 @@ def draw_aircraft_profile_window(screen, font, planes_or_snapshot, *_):
     if not snap:
         return
     if "altitude_history" in snap:
-        pts = snap["altitude_history"]
-        if len(pts) >= 2:
-            t0 = pts[0][0]
-            scale_x = width / max(1.0, pts[-1][0] - t0)
-            min_alt = min(a for _, a in pts)
-            max_alt = max(a for _, a in pts)
-            scale_y = (height - 120) / max(1.0, max_alt - min_alt)
-            graph_pts = [
-                (int((t - t0) * scale_x), int(height - 60 - (a - min_alt) * scale_y))
-                for t, a in pts
-            ]
-            if len(graph_pts) >= 2:
-                pygame.draw.lines(screen, (0, 255, 0), False, graph_pts, 2)
+        graph_pts = _altitude_polyline(snap["altitude_history"], width, height)
+        if len(graph_pts) >= 2:
+            pygame.draw.lines(screen, (0, 255, 0), False, graph_pts, 2)
 
     lines = [
         f"Model: {snap.get('icao', 'UNKNOWN')}",
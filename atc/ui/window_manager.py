@@ -1,5 +1,9 @@
 import pygame
 import multiprocessing
+import os
+import pickle
+import struct
+import zlib
 from constants import (
     WIDTH, HEIGHT,
     HELP_TEXT, WINDOW_AC_PROFILE,
@@ -7,12 +11,20 @@ from constants import (
     WINDOW_FLIGHT_PROGRESS, WINDOW_PERFORMANCE
 )
 from atc.utils import wrap_text, ensure_pygame_ready, calculate_layout
-from multiprocessing.managers import SyncManager, DictProxy
 from multiprocessing.process import BaseProcess
-from typing import Any, Dict, Optional, Callable
-
-_manager: Optional[SyncManager] = None
-_shared_state: Optional[DictProxy] = None
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Callable
+
+# Each shared-state key gets one shared memory block: [u64 seq][u32 length][pickled data].
+# The writer makes seq odd while it copies and even once done, so readers never lock.
+# Blocks are sized from the payload; when one outgrows its block the writer moves the key to
+# a larger block under the next generation number, which readers follow through a shared counter.
+SHARED_STATE_MIN_SIZE = 4096
+_HEADER = struct.Struct("<QI")
+
+_segments: dict[str, SharedMemory] = {}
+_last_payloads: dict[str, bytes] = {}
+_generations: dict[str, Any] = {}
 _active_windows: dict[str, BaseProcess] = {}
 
 def draw_help_window(screen, font, *_, **__):
@@ -102,24 +114,109 @@ def show_modal(title: str, message: str, font_name: str = "Consolas", font_size:
     )
     proc.start()
 
-def _ensure_manager() -> None:
-    global _manager, _shared_state
-    if _manager is None:
-        ctx = multiprocessing.get_context("spawn")
-        _manager = ctx.Manager()
-        _shared_state = _manager.dict()
+def _segment_name(key: str, owner_pid: int | None = None) -> str:
+    """Base shared memory name for `key` as published by process `owner_pid` (default: this one)."""
+    return f"pyatc_{owner_pid or os.getpid()}_{zlib.crc32(key.encode()):08x}"
 
+def _generation(key: str):
+    """Shared counter of the block generation currently holding `key`; 0 until first published."""
+    generation = _generations.get(key)
+    if generation is None:
+        generation = multiprocessing.get_context("spawn").RawValue("Q", 0)
+        _generations[key] = generation
+    return generation
 
 def update_shared_state(key: str, data: Any) -> None:
-    _ensure_manager()
-    assert _shared_state is not None
-    _shared_state[key] = data
+    payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    if _last_payloads.get(key) == payload:
+        return  # Unchanged, so leave seq alone and let readers skip the redraw.
+    _last_payloads[key] = payload
+    size = _HEADER.size + len(payload)
+
+    segment = _segments.get(key)
+    if segment is None or segment.size < size:
+        generation = _generation(key)
+        # Carry seq over so readers never see it go backwards across blocks.
+        seq = _HEADER.unpack_from(segment.buf)[0] if segment is not None else 0
+        new = SharedMemory(f"{_segment_name(key)}_{generation.value + 1}", create=True,
+                           size=max(SHARED_STATE_MIN_SIZE, 2 * size))
+        _HEADER.pack_into(new.buf, 0, seq, 0)
+        _segments[key] = new
+        _write_payload(new, payload)
+        generation.value += 1
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+        return
+
+    _write_payload(segment, payload)
+
+def _write_payload(segment: SharedMemory, payload: bytes) -> None:
+    buf = segment.buf
+    seq, _ = _HEADER.unpack_from(buf)
+    _HEADER.pack_into(buf, 0, seq + 1, 0)
+    buf[_HEADER.size:_HEADER.size + len(payload)] = payload
+    _HEADER.pack_into(buf, 0, seq + 2, len(payload))
+
+def _release_shared_state(key: str) -> None:
+    _last_payloads.pop(key, None)
+    segment = _segments.pop(key, None)
+    if segment is not None:
+        segment.close()
+        segment.unlink()
+
+class SharedStateReader:
+    """Reads one key published with update_shared_state, possibly from another process.
+
+    Attaches lazily, so it can be created before the writer's first update, and follows the
+    key to a new block whenever the writer's generation counter moves.
+    """
 
+    def __init__(self, name: str, generation):
+        self.name = name
+        self.seq = 0
+        self.data: Any = None
+        self._generation = generation
+        self._attached_generation = 0
+        self._segment: Optional[SharedMemory] = None
+
+    def read(self) -> Any:
+        """Return the latest data, unpickling only when the writer has published since the last read."""
+        generation = self._generation.value
+        if generation != self._attached_generation:
+            self.close()
+            try:
+                self._segment = SharedMemory(f"{self.name}_{generation}")
+            except FileNotFoundError:
+                return self.data  # Already replaced or released; retry next frame.
+            self._attached_generation = generation
+        if self._segment is None:
+            return self.data
+
+        buf = self._segment.buf
+        seq, length = _HEADER.unpack_from(buf)
+        if seq == self.seq or seq & 1:
+            return self.data
+        payload = bytes(buf[_HEADER.size:_HEADER.size + length])
+        if _HEADER.unpack_from(buf)[0] != seq:
+            return self.data  # Torn by a concurrent write; pick it up next frame.
+
+        self.seq = seq
+        self.data = pickle.loads(payload)
+        return self.data
+
+    def close(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+            self._attached_generation = 0
 
 def get_shared_state(key: str) -> Any:
-    _ensure_manager()
-    assert _shared_state is not None
-    return _shared_state.get(key)
+    segment = _segments.get(key)
+    if segment is None:
+        return None
+    seq, length = _HEADER.unpack_from(segment.buf)
+    return pickle.loads(segment.buf[_HEADER.size:_HEADER.size + length]) if seq else None
 
 def open_detached_window(
     title: str,
@@ -128,7 +225,6 @@ def open_detached_window(
     **kwargs: Any
 ) -> None:
     """Create and display a detached Pygame window in a new process."""
-    _ensure_manager()
     kwargs.pop("live", None)
 
     existing = _active_windows.get(title)
@@ -136,10 +232,9 @@ def open_detached_window(
         return
 
     ctx = multiprocessing.get_context("spawn")
-    assert _shared_state is not None
     proc = ctx.Process(
         target=_window_process,
-        args=(title, draw_func, _shared_state, title) + args,
+        args=(title, draw_func, _segment_name(title), _generation(title)) + args,
         kwargs=kwargs,
         daemon=True,
     )
@@ -147,18 +242,29 @@ def open_detached_window(
     _active_windows[title] = proc
 
 
+def open_window_titles() -> set[str]:
+    """Titles of detached windows still running; closed ones have their shared state released."""
+    for title, proc in list(_active_windows.items()):
+        if not proc.is_alive():
+            del _active_windows[title]
+            _release_shared_state(title)
+    return set(_active_windows)
+
 def close_all_windows() -> None:
-    """Safely close all active detached windows."""
+    """Safely close all active detached windows and release their shared state."""
     for proc in list(_active_windows.values()):
         if proc.is_alive():
             proc.terminate()
     _active_windows.clear()
 
+    for key in list(_segments):
+        _release_shared_state(key)
+
 def _window_process(
     title: str,
     draw_func: Callable[..., None],
-    shared_state_proxy: Dict[str, Any],
-    shared_key: str,
+    segment_name: str,
+    generation: Any,
     *args: Any,
     **kwargs: Any
 ) -> None:
@@ -179,28 +285,48 @@ def _window_process(
     else:
         window_size = (int(screen_w * 0.4), int(screen_h * 0.5))
 
-    pygame.display.set_mode(window_size, pygame.NOFRAME)
     window = pygame.display.set_mode(window_size, 0)
     pygame.display.set_caption(f"PyATC - {title}")
 
     font = pygame.font.SysFont("Consolas", 16)
     clock = pygame.time.Clock()
+    shared_state = SharedStateReader(segment_name, generation)
 
+    # Panels that return the Rect they drew only need that region pushed to the
+    # window once a full frame is up; anything else (or an expose) gets a flip.
+    # Frames where nothing new was published and nothing was exposed are skipped.
+    full_redraw = True
+    drawn_seq = -1
     running = True
     while running:
+        exposed = False
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED):
+                full_redraw = True
+                exposed = True
+
+        snapshot = shared_state.read()
+        if shared_state.seq == drawn_seq and not exposed:
+            clock.tick(30)
+            continue
+        drawn_seq = shared_state.seq
 
         window.fill((0, 0, 20))
-        snapshot = shared_state_proxy.get(shared_key)
+        dirty = None
         if snapshot is not None:
-            draw_func(screen=window, font=font, planes_or_snapshot=snapshot)
+            dirty = draw_func(screen=window, font=font, planes_or_snapshot=snapshot)
         else:
             msg = font.render("Waiting for data sync...", True, (200, 200, 100))
             window.blit(msg, (20, 20))
 
-        pygame.display.flip()
+        if isinstance(dirty, pygame.Rect) and not full_redraw:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
+            full_redraw = not isinstance(dirty, pygame.Rect)
         clock.tick(30)
 
+    shared_state.close()
     pygame.display.quit()
\ No newline at end of file
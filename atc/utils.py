@@ -1,5 +1,7 @@
-import math, os, sys, pygame
+import math, os, sys, functools, pygame
+import numpy as np
 from constants import *
+from atc.objects.flight_state import State
 
 def ensure_pygame_ready():
     """Safely initialize Pygame and its font subsystem if not active."""
@@ -26,24 +28,33 @@ def get_current_version() -> str:
     except Exception:
         return "v0.0.0"
 
+# Unit (dx, dy) screen vectors for headings quantised to 0.1 degree.
+HEADING_LUT_RES = 10
+HEADING_LUT_SIZE = 360 * HEADING_LUT_RES
+_hdg_rad = np.radians(np.arange(HEADING_LUT_SIZE) / HEADING_LUT_RES)
+HEADING_VEC_LUT = np.stack([np.sin(_hdg_rad), -np.cos(_hdg_rad)], axis=1)
+_HEADING_VEC_TUPLES = [tuple(v) for v in HEADING_VEC_LUT.tolist()]
+del _hdg_rad
+
 def load_runways(): return RUNWAYS
 def nm_to_px(nm): return nm/NM_PER_PX
 def px_to_nm(px): return px*NM_PER_PX
-def heading_to_vec(hdg): return math.sin(math.radians(hdg)), -math.cos(math.radians(hdg))
+def heading_to_vec(hdg): return _HEADING_VEC_TUPLES[int(hdg * HEADING_LUT_RES + 0.5) % HEADING_LUT_SIZE]
+def heading_lut_index(hdg: np.ndarray) -> np.ndarray: return (hdg * HEADING_LUT_RES + 0.5).astype(np.intp) % HEADING_LUT_SIZE
+def heading_vecs(hdg: np.ndarray) -> np.ndarray: return HEADING_VEC_LUT[heading_lut_index(hdg)]
 def normalize_hdg(h): return h % 360
 def shortest_turn_dir(a, b): return 1 if (b - a + 360) % 360 <= 180 else -1
 
-def get_callsign_from_iata(callsign: str) -> str:
-    from constants import AIRLINES
-
-    prefix = callsign[:2].upper()
-    number = callsign[2:].lstrip("0")
+_CALLSIGN_BY_IATA: dict[str, str] = {}
+for _data in AIRLINES.values():
+    _CALLSIGN_BY_IATA.setdefault(_data["IATA"].upper(), _data["Callsign"])
+del _data
 
-    for airline, data in AIRLINES.items():
-        if prefix == data["IATA"].upper():
-            return f"{data['Callsign']} {number}"
-
-    return callsign
+def get_callsign_from_iata(callsign: str) -> str:
+    spoken = _CALLSIGN_BY_IATA.get(callsign[:2].upper())
+    if spoken is None:
+        return callsign
+    return f"{spoken} {callsign[2:].lstrip('0')}"
 
 def get_heading_to_fix(ac, fix):
     dx = fix["x"] - ac.x
@@ -56,25 +67,48 @@ def distance_to_fix(ac, fix):
     dy = fix["y"] - ac.y
     return px_to_nm(math.hypot(dx, dy))
 
+def distance_to_fix_sq(ac, fix):
+    """Squared distance in NM^2, for threshold checks that don't need the root."""
+    dx = fix["x"] - ac.x
+    dy = fix["y"] - ac.y
+    return (dx * dx + dy * dy) * (NM_PER_PX * NM_PER_PX)
+
 def check_conflicts(planes):
-    res = []
-    for i, a in enumerate(planes):
-        for b in planes[i + 1:]:
-            if a.state == "LANDED" or b.state == "LANDED": continue
-            lat = a.distance_nm(b)
-            vert = a.vert_sep(b)
-            if lat < SAFE_LAT_NM and vert < SAFE_VERT_FT:
-                res.append((a, b, lat, vert))
-    return res
+    """Return (a, b, lateral_nm, vertical_ft) for every pair (a before b) inside separation minima."""
+    n = len(planes)
+    if n < 2:
+        return []
+
+    xs = np.fromiter((p.x for p in planes), dtype=float, count=n) * NM_PER_PX
+    ys = np.fromiter((p.y for p in planes), dtype=float, count=n) * NM_PER_PX
+    alts = np.fromiter((p.alt for p in planes), dtype=float, count=n)
+    active = np.fromiter((p.state != State.LANDED for p in planes), dtype=bool, count=n)
+
+    dx = xs[:, None] - xs[None, :]
+    dy = ys[:, None] - ys[None, :]
+    lat2 = dx * dx + dy * dy
+    vert = np.abs(alts[:, None] - alts[None, :])
+    mask = (lat2 < SAFE_LAT_NM * SAFE_LAT_NM) & (vert < SAFE_VERT_FT) & active[:, None] & active[None, :]
+    ii, jj = np.nonzero(np.triu(mask, 1))
+
+    lats = np.sqrt(lat2[ii, jj]).tolist()
+    verts = vert[ii, jj].tolist()
+    return [
+        (planes[i], planes[j], lat, v)
+        for i, j, lat, v in zip(ii.tolist(), jj.tolist(), lats, verts)
+    ]
 
 def load_fixes(layout: dict | None = None):
-    """Return dynamically scaled fix coordinates based on current layout."""
+    """Return dynamically scaled fix coordinates based on current layout.
+
+    Results are cached per radar size and shared between callers, so treat them as read-only.
+    """
     if layout is None:
         layout = calculate_layout(WIDTH, HEIGHT)
+    return _scaled_fixes(layout["RADAR_WIDTH"], layout["RADAR_HEIGHT"])
 
-    radar_width = layout["RADAR_WIDTH"]
-    radar_height = layout["RADAR_HEIGHT"]
-
+@functools.lru_cache(maxsize=8)
+def _scaled_fixes(radar_width: int, radar_height: int) -> dict:
     scale_x = radar_width / WIDTH
     scale_y = radar_height / HEIGHT
 
@@ -86,8 +120,12 @@ def load_fixes(layout: dict | None = None):
         }
     return scaled
 
+@functools.lru_cache(maxsize=8)
 def calculate_layout(width: int, height: int) -> dict:
-    """Generate a responsive, scale-aware layout for PyATC."""
+    """Generate a responsive, scale-aware layout for PyATC.
+
+    Results are cached per (width, height) and shared between callers, so treat them as read-only.
+    """
 
     sidebar_ratio = 0.18
     console_ratio = 0.07
@@ -136,6 +174,19 @@ def calculate_layout(width: int, height: int) -> dict:
 
     return layout
 
+@functools.lru_cache(maxsize=32)
+def get_font(size: int, name: str = DEFAULT_FONT) -> pygame.font.Font:
+    """Shared SysFont for (size, name); building a SysFont scans system fonts, so never do it per frame."""
+    return pygame.font.SysFont(name, size)
+
+@functools.lru_cache(maxsize=1024)
+def render_cached(font: pygame.font.Font, text: str, colour: tuple) -> pygame.Surface:
+    """Antialiased font.render memoised for strings that repeat across frames.
+
+    The Surface is shared between callers, so blit it but never draw onto it.
+    """
+    return font.render(text, True, colour)
+
 def wrap_text(text, font, max_width):
     words = text.split()
     lines = []
@@ -186,11 +237,16 @@ def scale_position(x, y, layout: dict) -> tuple[int, int]:
     scale_y = layout["RADAR_HEIGHT"] / HEIGHT
     return int(x * scale_x), int(y * scale_y)
 
+def scale_positions(xs: np.ndarray, ys: np.ndarray, layout: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of scale_position; truncates to int the same way."""
+    scale_x = layout["RADAR_WIDTH"] / WIDTH
+    scale_y = layout["RADAR_HEIGHT"] / HEIGHT
+    return (xs * scale_x).astype(np.intp), (ys * scale_y).astype(np.intp)
+
 def isa_density_at_alt_ft(alt_ft: float, qnh_hpa: float = 1013.25, isa_deviation_c: float = 0.0) -> float:
     """
     Return air density (kg/m^3) using a simple ISA model up to the tropopause.
     """
-    import math
     alt_m = alt_ft * 0.3048
     # ISA sea level
     rho0 = 1.225    # kg/m^3
@@ -13,21 +13,22 @@ from typing import Optional
 from update_checker import check_for_update
 from atc.ai.voice import speak
 from atc.ai.controller import AIController
+from atc.ai.snapshot import PlaneSnapshot
 from atc.objects.runway_v2 import all_runways
-from atc.objects.aircraft_v2 import spawn_random_plane
-from atc.radar import draw_radar, draw_performance_menu, draw_flight_progress_log, draw_aircraft_profile_window, hit_test_aircraft
+from atc.objects.aircraft_v2 import spawn_random_plane, spawn_random_planes, update_fleet
+from atc.radar import draw_radar, draw_performance_menu, draw_flight_progress_log, draw_aircraft_profile_window, hit_test_aircraft, flight_progress_records
 from atc.utils import (
     check_conflicts, calculate_layout, get_current_version,
-    ensure_pygame_ready, scale_position
+    ensure_pygame_ready, get_font
 )
 from atc.command_parser import CommandParser
 from atc.ui.window_manager import (
     open_detached_window, close_all_windows, update_shared_state,
-    show_modal, draw_help_window
+    open_window_titles, show_modal, draw_help_window
 )
 from constants import (
     FPS, SIM_SPEED, ERROR_LOG_FILE, RESPONSE_VOICE,
-    INITIAL_PLANE_COUNT, DEFAULT_FONT, WINDOW_FLIGHT_PROGRESS,
+    INITIAL_PLANE_COUNT, WINDOW_FLIGHT_PROGRESS,
     WINDOW_MAIN, FUNCTION_KEYS, WINDOW_PERFORMANCE, HELP_TEXT,
     COLOUR_CONSOLE_BG, COLOUR_CONSOLE_TEXT, WINDOW_ERROR, TRAFFIC_MAX,
     AI_TRAFFIC, WINDOW_HELP, ACK_DELAY_RANGE, RUNWAY_TAKEOFF_DELAY_S,
@@ -159,7 +160,7 @@ def handle_keyboard_input(event, state):
         results = parser.parse(state["input_str"], state["planes"])
 
         if state["input_str"].strip().upper() == "HELP":
-            open_detached_window("Help", draw_help_window)
+            open_help_window()
             state["input_str"] = ""
             state["cursor_pos"] = 0
             return
@@ -193,7 +194,7 @@ def handle_keyboard_input(event, state):
         state["cursor_pos"] = min(len(state["input_str"]), state["cursor_pos"] + 1)
 
     elif key == FUNCTION_KEYS["help"]:
-        open_detached_window(WINDOW_HELP, draw_help_window)
+        open_help_window()
     elif key == FUNCTION_KEYS["performance"]:
         open_detached_window(WINDOW_PERFORMANCE, draw_performance_menu, state["planes"], state["runways"], SIM_SPEED)
     elif key == FUNCTION_KEYS["flight_progress"]:
@@ -254,9 +255,9 @@ def handle_aircraft_spawning(state, dt):
         state["planes"].append(new_plane)
         state["spawn_timer"] = 0.0
         
-        print(f"[SPAWN] {new_plane.callsign} added (runway={getattr(new_plane, 'on_runway', False)})")
+        print(f"[SPAWN] {new_plane.callsign} added (runway={new_plane.on_runway})")
 
-        if getattr(new_plane, "on_runway", False):
+        if new_plane.on_runway:
             rwy = new_plane.assigned_runway or "XX"
             msg = MSG_REQUEST_TAKEOFF.format(cs=new_plane.callsign, rwy=rwy)
             state["radio_log"][new_plane.callsign].append({
@@ -271,20 +272,14 @@ def handle_aircraft_spawning(state, dt):
 
 def handle_mouse_input(event, state, layout):
     """Handles all radar + sidebar mouse interactions (selection, scrolling)."""
-    mx, my = event.pos
-    scale = layout["RING_SCALE"]
-
     if event.button == 1:
-        for p in state["planes"]:
-            px, py = scale_position(p.x, p.y, layout)
-            hit_radius = max(6, int(10 * scale))
-            if (px - mx) ** 2 + (py - my) ** 2 < hit_radius ** 2:
-                state["selected_plane"] = p
-                state["active_cs"] = p.callsign
-                state["input_str"] = f"{p.callsign} "
-                state["cursor_pos"] = len(state["input_str"])
-                state["radio_scroll"] = 0
-                break
+        p = hit_test_aircraft(event.pos, state["planes"], layout)
+        if p:
+            state["selected_plane"] = p
+            state["active_cs"] = p.callsign
+            state["input_str"] = f"{p.callsign} "
+            state["cursor_pos"] = len(state["input_str"])
+            state["radio_scroll"] = 0
         else:
             state["selected_plane"] = None
             state["active_cs"] = None
@@ -294,7 +289,7 @@ def handle_mouse_input(event, state, layout):
     elif event.button == 3:
         plane = hit_test_aircraft(event.pos, state["planes"], layout)
         if plane:
-            if getattr(plane, "_use_new_physics", False):
+            if plane._use_new_physics:
                 title = f"{WINDOW_AC_PROFILE} — {plane.callsign}"
                 open_detached_window(
                     title,
@@ -312,51 +307,58 @@ def handle_mouse_input(event, state, layout):
     elif event.button == 5:
         state["radio_scroll"] += 1
 
+def open_help_window():
+    """Publish the (constant) help text once and open its detached window."""
+    update_shared_state(WINDOW_HELP, {"title": f"PyATC {VERSION} Help Reference", "text": HELP_TEXT})
+    open_detached_window(WINDOW_HELP, draw_help_window)
+
 def update_simulation(state, dt):
     """Runs aircraft updates, detects conflicts, and pushes info to detached windows."""
     try:
-        for plane in state["planes"]:
-            plane.update(dt)
+        update_fleet(state["planes"], dt)
     except Exception:
         handle_exception(*sys.exc_info())
 
     state["conflicts"] = check_conflicts(state["planes"])
 
+    # Only publish state for detached windows that are showing it.
+    open_windows = open_window_titles()
     for plane in state["planes"]:
-        if getattr(plane, "_use_new_physics", False):
+        if not plane._use_new_physics:
+            continue
+        profile_key = f"{WINDOW_AC_PROFILE} — {plane.callsign}"
+        if profile_key in open_windows:
             snap = {
                 "callsign": plane.callsign,
                 "alt": plane.alt,
                 "spd": plane.spd,
-                "weight_kg": getattr(plane, "weight_kg", 0),
-                "fuel_kg": getattr(plane, "fuel_kg", 0),
-                "fuel_capacity_kg": getattr(plane, "fuel_capacity_kg", 0),
-                "thrust_pct": getattr(plane, "thrust_pct", 0),
-                "flap_state": getattr(plane, "flap_state", 0),
-                "gear_down": getattr(plane, "gear_down", False),
-                "icao": getattr(plane, "icao", "UNKNOWN"),
-                "altitude_history": getattr(plane, "altitude_history", []),
+                "weight_kg": plane.weight_kg,
+                "fuel_kg": plane.fuel_kg,
+                "fuel_capacity_kg": plane.fuel_capacity_kg,
+                "thrust_pct": plane.thrust_pct,
+                "flap_state": plane.flap_state,
+                "gear_down": plane.gear_down,
+                "icao": plane.icao,
+                "altitude_history": plane.altitude_history,
             }
-            update_shared_state(f"{WINDOW_AC_PROFILE} — {plane.callsign}", snap)
+            update_shared_state(profile_key, snap)
 
-    update_shared_state(WINDOW_FLIGHT_PROGRESS, [
-        {"callsign": p.callsign, "alt": p.alt, "spd": p.spd, "hdg": p.hdg, "state": p.state}
-        for p in state["planes"]
-    ])
+    if WINDOW_FLIGHT_PROGRESS in open_windows:
+        update_shared_state(WINDOW_FLIGHT_PROGRESS, flight_progress_records(state["planes"]))
 
     # performance window
-    update_shared_state(WINDOW_PERFORMANCE, {
-        "fps": int(state.get("fps_avg", 0)),
-        "sim_speed": SIM_SPEED,
-        "cpu_percent": psutil.cpu_percent(interval=None),
-        "used_mem_mb": psutil.virtual_memory().used / (1024 ** 2),
-        "total_mem_mb": psutil.virtual_memory().total / (1024 ** 2),
-        "plane_count": len(state["planes"]),
-        "runway_count": len(state["runways"]),
-        "occupied": ', '.join(r.name for r in state["runways"] if r.status == 'OCCUPIED') or 'None',
-    })
-
-    update_shared_state(WINDOW_HELP, {"title": f"PyATC {VERSION} Help Reference", "text": HELP_TEXT})
+    if WINDOW_PERFORMANCE in open_windows:
+        memory = psutil.virtual_memory()
+        update_shared_state(WINDOW_PERFORMANCE, {
+            "fps": int(state.get("fps_avg", 0)),
+            "sim_speed": SIM_SPEED,
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "used_mem_mb": memory.used / (1024 ** 2),
+            "total_mem_mb": memory.total / (1024 ** 2),
+            "plane_count": len(state["planes"]),
+            "runway_count": len(state["runways"]),
+            "occupied": ', '.join(r.name for r in state["runways"] if r.status == 'OCCUPIED') or 'None',
+        })
 
 
 def render_console(screen, state, layout):
@@ -364,7 +366,7 @@ def render_console(screen, state, layout):
     rect = layout["CONSOLE_RECT"]
     pygame.draw.rect(screen, COLOUR_CONSOLE_BG, rect)
 
-    font_console = pygame.font.SysFont(DEFAULT_FONT, layout["FONT_SIZE_CONSOLE"])
+    font_console = get_font(layout["FONT_SIZE_CONSOLE"])
     prompt = f"> {state['input_str']}"
     txt = font_console.render(prompt, True, COLOUR_CONSOLE_TEXT)
     text_y = rect.y + (rect.height - txt.get_height()) // 2
@@ -384,10 +386,9 @@ def render_console(screen, state, layout):
 def render_clock(screen):
     """Renders the bottom-right UTC clock (scales with window size)."""
     import datetime
-    from constants import DEFAULT_FONT
     window_w, window_h = screen.get_size()
     scaled_size = max(12, int(window_h * 0.025))
-    font = pygame.font.SysFont(DEFAULT_FONT, scaled_size)
+    font = get_font(scaled_size)
 
     now = datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M:%S UTC")
     text = font.render(now, True, (0, 255, 0))
@@ -415,7 +416,7 @@ def main():
 
     # Core simulation state container
     state = {
-        "planes": [spawn_random_plane(i) for i in range(1, INITIAL_PLANE_COUNT + 1)],
+        "planes": spawn_random_planes(INITIAL_PLANE_COUNT),
         "runways": all_runways(),
         "radio_log": defaultdict(list),
         "messages": [],
@@ -445,7 +446,7 @@ def main():
 
         # ai logic (spawn/move planes)
         if state.get("ai_enabled"):
-            ai.update(state["planes"], state["runways"], dt)
+            ai.update(PlaneSnapshot.build(state["planes"]), state["runways"], dt)
 
         handle_aircraft_spawning(state, dt)
 
@@ -474,14 +475,14 @@ def main():
         if not pygame.font.get_init():
             pygame.font.init()
 
-        font_radar = pygame.font.SysFont(DEFAULT_FONT, layout["FONT_SIZE_RADAR"])
+        font_radar = get_font(layout["FONT_SIZE_RADAR"])
 
         # screen draws
         draw_radar(
             screen, state["planes"], font_radar, state["conflicts"],
             radio_log=state["radio_log"], active_cs=state["active_cs"],
             selected_plane=state["selected_plane"], radio_scroll=state["radio_scroll"],
-            runways=state["runways"]
+            runways=state["runways"], layout=layout
         )
         render_console(screen, state, layout)
         render_clock(screen)